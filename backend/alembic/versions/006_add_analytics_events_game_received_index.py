@@ -0,0 +1,32 @@
+"""Add composite index for per-game analytics range scans
+
+Post-launch aggregation filters analytics events by game and a
+received_at window, then groups by event_type. A composite index on
+those three columns turns the scan into an index range scan.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (game_id, received_at, event_type) index on analytics_events."""
+    op.create_index(
+        'idx_analytics_events_game_received_type',
+        'analytics_events',
+        ['game_id', 'received_at', 'event_type'],
+    )
+
+
+def downgrade() -> None:
+    """Drop the composite analytics_events index."""
+    op.drop_index('idx_analytics_events_game_received_type', 'analytics_events')
@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import api_router
 from app.core.config import settings
+from app.services.github_service import get_github_service
 
 # Configure structured logging
 structlog.configure(
@@ -44,6 +45,7 @@ async def lifespan(app: FastAPI):
     )
     yield
     logger.info("application_shutting_down")
+    await get_github_service().aclose()
 
 
 # Create FastAPI application
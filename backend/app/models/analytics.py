@@ -13,6 +13,7 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -32,6 +33,15 @@ class AnalyticsEvent(Base):
     """Raw analytics event from a game."""
 
     __tablename__ = "analytics_events"
+    __table_args__ = (
+        # Per-game time-window scans grouped by event type (post-launch step)
+        Index(
+            "idx_analytics_events_game_received_type",
+            "game_id",
+            "received_at",
+            "event_type",
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
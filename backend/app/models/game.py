@@ -88,6 +88,11 @@ class Game(Base):
         """Progress as percentage through steps."""
         return (self.current_step / 12) * 100
 
+    @property
+    def app_id(self) -> str:
+        """Android application id derived from the slug."""
+        return f"com.gamefactory.{self.slug.replace('-', '_')}"
+
     @property
     def latest_build(self) -> Optional["GameBuild"]:
         """Get the most recent build."""
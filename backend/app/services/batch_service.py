@@ -136,7 +136,7 @@ class BatchService:
         # Trigger async processing via Celery
         from app.workers.tasks import process_batch
 
-        process_batch.delay(str(batch_id))
+        process_batch.delay(batch_id)
 
         logger.info("batch_started", batch_id=str(batch_id))
 
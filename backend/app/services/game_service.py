@@ -7,10 +7,11 @@ Handles individual game operations and workflow progression.
 import re
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, List, Optional, Set
 
 import structlog
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -21,6 +22,9 @@ from app.schemas.game import GameCreate
 
 logger = structlog.get_logger()
 
+# Rows per multi-row INSERT when creating step records
+_STEP_INSERT_BATCH_SIZE = 1000
+
 
 class GameService:
     """Service for game operations."""
@@ -63,14 +67,34 @@ class GameService:
 
     async def _initialize_steps(self, game_id: uuid.UUID) -> None:
         """Initialize all step records for a game."""
-        for step_num, step_def in STEP_DEFINITIONS.items():
-            step = GameStep(
-                game_id=game_id,
-                step_number=step_num,
-                step_name=step_def["name"].value,
-                status="pending",
+        await self._initialize_steps_bulk([game_id])
+
+    async def _initialize_steps_bulk(self, game_ids: Iterable[uuid.UUID]) -> None:
+        """
+        Initialize all step records for several games at once.
+
+        Rows are written with multi-row INSERTs; steps that already exist
+        are left untouched.
+        """
+        rows = [
+            {
+                "game_id": game_id,
+                "step_number": step_num,
+                "step_name": step_def["name"].value,
+                "status": "pending",
+            }
+            for game_id in game_ids
+            for step_num, step_def in STEP_DEFINITIONS.items()
+        ]
+        if not rows:
+            return
+
+        for start in range(0, len(rows), _STEP_INSERT_BATCH_SIZE):
+            await self.db.execute(
+                insert(GameStep)
+                .values(rows[start:start + _STEP_INSERT_BATCH_SIZE])
+                .on_conflict_do_nothing(constraint="unique_game_step")
             )
-            self.db.add(step)
 
         await self.db.commit()
 
@@ -108,6 +132,23 @@ class GameService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def stream_game_ids(
+        self,
+        status: Optional[str] = None,
+    ) -> AsyncIterator[uuid.UUID]:
+        """
+        Yield game IDs, optionally filtered by status.
+
+        Rows come from a server-side cursor, so the full result set is never
+        loaded at once.
+        """
+        query = select(Game.id)
+        if status:
+            query = query.where(Game.status == status)
+
+        async for game_id in await self.db.stream_scalars(query):
+            yield game_id
+
     async def get_game_steps(self, game_id: uuid.UUID) -> List[GameStep]:
         """Get all steps for a game."""
         result = await self.db.execute(
@@ -117,6 +158,17 @@ class GameService:
         )
         return list(result.scalars().all())
 
+    async def get_games_with_steps(self, game_ids: List[uuid.UUID]) -> Set[uuid.UUID]:
+        """Return which of the given games already have step records."""
+        if not game_ids:
+            return set()
+        result = await self.db.execute(
+            select(GameStep.game_id)
+            .where(GameStep.game_id.in_(game_ids))
+            .distinct()
+        )
+        return set(result.scalars().all())
+
     async def get_step(self, game_id: uuid.UUID, step_number: int) -> Optional[GameStep]:
         """Get a specific step for a game."""
         result = await self.db.execute(
@@ -135,9 +187,18 @@ class GameService:
         validation_results: dict = None,
         error_message: str = None,
         logs: str = None,
+        commit: bool = True,
+        step: Optional[GameStep] = None,
     ) -> Optional[GameStep]:
-        """Update step status and optionally artifacts."""
-        step = await self.get_step(game_id, step_number)
+        """
+        Update step status and optionally artifacts.
+
+        With commit=False the changes are left in the session for the
+        caller to commit together with its other writes. Callers that
+        already hold the loaded step can pass it to skip the lookup.
+        """
+        if step is None:
+            step = await self.get_step(game_id, step_number)
         if not step:
             return None
 
@@ -157,12 +218,15 @@ class GameService:
         if logs:
             step.logs = logs
 
-        await self.db.commit()
-        await self.db.refresh(step)
+        if commit:
+            await self.db.commit()
+            await self.db.refresh(step)
 
         # If step completed, update game's current_step
         if status == "completed":
-            game = await self.get_game(game_id)
+            # Identity-map lookup; only the game row is needed here, not
+            # the steps/assets/builds get_game() eager-loads
+            game = await self.db.get(Game, game_id)
             if game and game.current_step < step_number:
                 game.current_step = step_number
                 game.updated_at = datetime.utcnow()
@@ -171,7 +235,8 @@ class GameService:
                 if step_number >= 12:
                     game.status = "completed"
 
-                await self.db.commit()
+                if commit:
+                    await self.db.commit()
 
         return step
 
@@ -217,10 +282,10 @@ class GameService:
 
         await self.db.commit()
 
-        # Trigger step execution
-        from app.workers.tasks import execute_step
+        # Re-run the pipeline from this step onwards
+        from app.workers.tasks import pipeline_signature
 
-        execute_step.delay(str(game_id), step_number)
+        pipeline_signature(game_id, step_number).apply_async()
 
         logger.info(
             "step_retry_triggered",
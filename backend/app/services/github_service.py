@@ -10,11 +10,14 @@ Provides full GitHub integration for repository management:
 
 import asyncio
 import base64
+import hashlib
+import json
 import os
 import shutil
 import tempfile
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import httpx
 import structlog
@@ -26,6 +29,72 @@ from app.core.config import settings
 
 logger = structlog.get_logger()
 
+# File content accepted by the multi-file commit helpers; bytes are sent
+# as-is, str is UTF-8 encoded
+FileContent = Union[str, bytes]
+
+# Maximum number of blob uploads in flight for a single multi-file commit;
+# kept low because GitHub applies secondary rate limits to concurrent
+# content-creating requests
+BLOB_UPLOAD_CONCURRENCY = 3
+
+# Times a rate-limited (403/429) request is retried after waiting
+RATE_LIMIT_RETRIES = 3
+
+# Seconds to wait when a rate-limit response carries no Retry-After
+RATE_LIMIT_DEFAULT_WAIT = 60
+
+# GraphQL commit attempts before falling back to the Git Data API, and the
+# base delay of the exponential backoff between them
+GRAPHQL_COMMIT_ATTEMPTS = 3
+GRAPHQL_COMMIT_RETRY_DELAY = 1.0
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = f"{GITHUB_API_URL}/graphql"
+
+_CREATE_COMMIT_ON_BRANCH_MUTATION = """
+mutation($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) {
+    commit {
+      oid
+      url
+    }
+  }
+}
+"""
+
+
+def _to_bytes(content: FileContent) -> bytes:
+    """Encode file content to bytes, skipping the encode for bytes input."""
+    return content if isinstance(content, bytes) else content.encode("utf-8")
+
+
+def _rate_limit_wait(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait before retrying a rate-limited response, else None."""
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            return RATE_LIMIT_DEFAULT_WAIT
+    if response.headers.get("x-ratelimit-remaining") == "0":
+        reset = response.headers.get("x-ratelimit-reset")
+        if reset is not None and reset.isdigit():
+            return max(int(reset) - time.time(), 0.0)
+        return RATE_LIMIT_DEFAULT_WAIT
+    if response.status_code == 429:
+        return RATE_LIMIT_DEFAULT_WAIT
+    # A plain 403 is a permissions error, not a rate limit
+    return None
+
+
+def git_blob_sha(content: FileContent) -> str:
+    """Compute the SHA git assigns to a blob with this content."""
+    data = _to_bytes(content)
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
 
 class GitHubService:
     """
@@ -39,6 +108,7 @@ class GitHubService:
         self.github: Optional[Github] = None
         self.token = settings.github_token
         self.org = settings.github_org
+        self._http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
         self._initialize_client()
 
     def _initialize_client(self):
@@ -57,6 +127,67 @@ class GitHubService:
                 "GitHub client not initialized. Set GITHUB_TOKEN environment variable."
             )
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled HTTP client for direct API calls.
+        
+        The client keeps connections alive across requests. Clients are
+        bound to the event loop they were created on, so one is kept per
+        loop; Celery workers run every task on one long-lived loop. Close
+        them all with aclose() before their loops end.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._http_clients.get(loop)
+        if client is None:
+            # A client whose loop has already closed can no longer be closed
+            for stale_loop in [other for other in self._http_clients if other.is_closed()]:
+                del self._http_clients[stale_loop]
+                logger.warning("http_client_loop_closed_before_aclose")
+            client = self._http_clients[loop] = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=50,
+                ),
+                transport=httpx.AsyncHTTPTransport(retries=2),
+            )
+        return client
+
+    async def _post_with_backoff(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        POST through the pooled client, waiting out rate-limit responses.
+        
+        429s, and 403s that carry Retry-After or an exhausted rate limit, are
+        retried up to RATE_LIMIT_RETRIES times after the advertised wait.
+        """
+        client = self._get_http_client()
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = await client.post(url, **kwargs)
+            wait = _rate_limit_wait(response)
+            if wait is None or attempt == RATE_LIMIT_RETRIES:
+                break
+            logger.warning(
+                "github_rate_limited",
+                status=response.status_code,
+                wait=wait,
+                attempt=attempt + 1,
+            )
+            await asyncio.sleep(wait)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients of every loop that is still open."""
+        current = asyncio.get_running_loop()
+        clients, self._http_clients = self._http_clients, {}
+        for loop, client in clients.items():
+            if loop is current:
+                await client.aclose()
+            elif loop.is_running():
+                # Closing must happen on the loop that owns the connections
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                )
+
     async def create_repository(
         self,
         name: str,
@@ -376,9 +507,9 @@ class GitHubService:
     async def create_multiple_files(
         self,
         repo_name: str,
-        files: Dict[str, str],
+        files: Dict[str, FileContent],
         commit_message: str,
-        branch: str = "main",
+        branch: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Create multiple files in a single commit using Git Data API.
@@ -387,7 +518,7 @@ class GitHubService:
             repo_name: Repository name
             files: Dict of {file_path: content}
             commit_message: Commit message
-            branch: Target branch
+            branch: Target branch (defaults to the repository's default branch)
         
         Returns:
             Operation result
@@ -396,59 +527,320 @@ class GitHubService:
 
         try:
             repo = self._get_repo(repo_name)
-            
-            # Get the current commit SHA
-            ref = repo.get_git_ref(f"heads/{branch}")
-            current_sha = ref.object.sha
-            current_commit = repo.get_git_commit(current_sha)
-            base_tree = current_commit.tree
-
-            # Create tree elements for each file
-            tree_elements = []
-            for path, content in files.items():
-                blob = repo.create_git_blob(content, "utf-8")
-                tree_elements.append(
-                    InputGitTreeElement(
-                        path=path,
-                        mode="100644",
-                        type="blob",
-                        sha=blob.sha,
-                    )
-                )
+            return await self._commit_files(
+                repo, files, commit_message, branch or repo.default_branch
+            )
+
+        except (GithubException, httpx.HTTPError) as e:
+            logger.error("multi_file_creation_failed", error=str(e))
+            return {
+                "success": False,
+                "error": str(e),
+            }
+
+    async def commit_files_if_changed(
+        self,
+        repo_name: str,
+        files: Dict[str, FileContent],
+        commit_message: str,
+        branch: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Commit files unless the branch already has identical copies.
+        
+        Commits with one GraphQL call, retried with exponential backoff, and
+        falls back to the Git Data API if every attempt fails.
+        
+        Args:
+            repo_name: Repository name
+            files: Dict of {file_path: content}
+            commit_message: Commit message
+            branch: Target branch (defaults to the repository's default branch)
+        
+        Returns:
+            Operation result; "skipped" is set when nothing needed committing
+            and "fallback" when the Git Data API was used
+        """
+        if branch is None:
+            branch = self.default_branch(repo_name)
+
+        # Retried steps skip the commit when nothing changed
+        if await self.files_match_branch(repo_name, files, branch):
+            return {"success": True, "skipped": True}
+
+        for attempt in range(GRAPHQL_COMMIT_ATTEMPTS):
+            result = await self.create_commit_on_branch_graphql(
+                repo_name=repo_name,
+                branch=branch,
+                files=files,
+                commit_message=commit_message,
+            )
+            if result["success"]:
+                return result
+
+            logger.warning(
+                "graphql_commit_retry",
+                repo=repo_name,
+                attempt=attempt + 1,
+                max_attempts=GRAPHQL_COMMIT_ATTEMPTS,
+                error=result.get("error"),
+            )
+            if attempt < GRAPHQL_COMMIT_ATTEMPTS - 1:
+                await asyncio.sleep(GRAPHQL_COMMIT_RETRY_DELAY * (2 ** attempt))
+
+        result = await self.create_multiple_files(
+            repo_name, files, commit_message, branch=branch
+        )
+        result["fallback"] = True
+        return result
+
+    async def create_commit_on_branch_graphql(
+        self,
+        repo_name: str,
+        branch: str,
+        files: Dict[str, FileContent],
+        commit_message: str,
+    ) -> Dict[str, Any]:
+        """
+        Commit multiple files with a single GraphQL createCommitOnBranch call.
+        
+        All file contents travel in one request, instead of one REST call
+        per blob plus tree, commit and ref updates.
+        
+        Args:
+            repo_name: Repository name
+            branch: Target branch
+            files: Dict of {file_path: content}
+            commit_message: Commit message
+        
+        Returns:
+            Operation result
+        """
+        self._ensure_client()
 
-            # Create new tree
-            new_tree = repo.create_git_tree(tree_elements, base_tree)
+        try:
+            repo = self._get_repo(repo_name)
+            head_sha = repo.get_git_ref(f"heads/{branch}").object.sha
+
+            variables = {
+                "input": {
+                    "branch": {
+                        "repositoryNameWithOwner": repo.full_name,
+                        "branchName": branch,
+                    },
+                    "message": {"headline": commit_message},
+                    "expectedHeadOid": head_sha,
+                    "fileChanges": {
+                        "additions": [
+                            {
+                                "path": path,
+                                "contents": base64.b64encode(
+                                    _to_bytes(content)
+                                ).decode("ascii"),
+                            }
+                            for path, content in files.items()
+                        ],
+                    },
+                },
+            }
 
-            # Create commit
-            new_commit = repo.create_git_commit(
-                commit_message,
-                new_tree,
-                [current_commit],
+            # Serialize the envelope once, compactly, straight to bytes
+            body = json.dumps(
+                {"query": _CREATE_COMMIT_ON_BRANCH_MUTATION, "variables": variables},
+                separators=(",", ":"),
+            ).encode("ascii")
+
+            response = await self._get_http_client().post(
+                GITHUB_GRAPHQL_URL,
+                content=body,
+                headers={
+                    "Authorization": f"bearer {self.token}",
+                    "Content-Type": "application/json",
+                },
             )
+            response.raise_for_status()
+            payload = response.json()
+
+            if payload.get("errors"):
+                error = "; ".join(e.get("message", "") for e in payload["errors"])
+                logger.error("graphql_commit_failed", repo=repo_name, error=error)
+                return {
+                    "success": False,
+                    "error": error,
+                }
 
-            # Update reference
-            ref.edit(new_commit.sha)
+            commit = payload["data"]["createCommitOnBranch"]["commit"]
 
             logger.info(
                 "multiple_files_created",
                 repo=repo_name,
+                branch=branch,
                 file_count=len(files),
-                commit=new_commit.sha,
+                commit=commit["oid"],
             )
 
             return {
                 "success": True,
-                "commit_sha": new_commit.sha,
+                "commit_sha": commit["oid"],
                 "files_created": len(files),
             }
 
-        except GithubException as e:
-            logger.error("multi_file_creation_failed", error=str(e))
+        except (GithubException, httpx.HTTPError) as e:
+            logger.error("graphql_commit_failed", repo=repo_name, error=str(e))
             return {
                 "success": False,
                 "error": str(e),
             }
 
+    async def files_match_branch(
+        self,
+        repo_name: str,
+        files: Dict[str, FileContent],
+        branch: str = "main",
+    ) -> bool:
+        """
+        Check whether every file already exists on a branch with identical content.
+        
+        Fetches the branch tree once and compares git blob SHAs locally, so
+        retried steps can skip re-committing unchanged files.
+        
+        Args:
+            repo_name: Repository name
+            files: Dict of {file_path: content}
+            branch: Branch to compare against
+        
+        Returns:
+            True if all files match, False otherwise (including on errors)
+        """
+        self._ensure_client()
+
+        try:
+            repo = self._get_repo(repo_name)
+            tree = repo.get_git_tree(branch, recursive=True)
+        except GithubException as e:
+            logger.warning("tree_lookup_failed", repo=repo_name, error=str(e))
+            return False
+
+        remote_shas = {
+            element.path: element.sha
+            for element in tree.tree
+            if element.type == "blob"
+        }
+        return all(
+            remote_shas.get(path) == git_blob_sha(content)
+            for path, content in files.items()
+        )
+
+    async def _commit_files(
+        self,
+        repo: Repository,
+        files: Dict[str, FileContent],
+        commit_message: str,
+        branch: str,
+    ) -> Dict[str, Any]:
+        """Write files as blobs, then one tree, one commit and one ref update."""
+        # Get the current commit SHA
+        ref = repo.get_git_ref(f"heads/{branch}")
+        current_sha = ref.object.sha
+        current_commit = repo.get_git_commit(current_sha)
+        base_tree = current_commit.tree
+
+        # Upload blobs a few at a time instead of one round-trip per file.
+        # This goes through the pooled httpx client: PyGithub's client keeps
+        # a single connection and is not safe to share between threads.
+        semaphore = asyncio.Semaphore(BLOB_UPLOAD_CONCURRENCY)
+        blobs_url = f"{GITHUB_API_URL}/repos/{repo.full_name}/git/blobs"
+        headers = {
+            "Authorization": f"bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+        }
+
+        async def _upload_blob(content: FileContent) -> str:
+            encoded = base64.b64encode(_to_bytes(content)).decode("ascii")
+            async with semaphore:
+                response = await self._post_with_backoff(
+                    blobs_url,
+                    json={"content": encoded, "encoding": "base64"},
+                    headers=headers,
+                )
+            response.raise_for_status()
+            return response.json()["sha"]
+
+        # The task group cancels the remaining uploads on the first failure
+        try:
+            async with asyncio.TaskGroup() as group:
+                uploads = [
+                    group.create_task(_upload_blob(content))
+                    for content in files.values()
+                ]
+        except ExceptionGroup as eg:
+            # Surface the first failure so callers' except clauses still match
+            raise eg.exceptions[0]
+        blob_shas = [upload.result() for upload in uploads]
+
+        # Create tree elements for each file
+        tree_elements = [
+            InputGitTreeElement(
+                path=path,
+                mode="100644",
+                type="blob",
+                sha=blob_sha,
+            )
+            for path, blob_sha in zip(files, blob_shas)
+        ]
+
+        # Create new tree
+        new_tree = repo.create_git_tree(tree_elements, base_tree)
+
+        # Create commit
+        new_commit = repo.create_git_commit(
+            commit_message,
+            new_tree,
+            [current_commit],
+        )
+
+        # Update reference
+        ref.edit(new_commit.sha)
+
+        logger.info(
+            "multiple_files_created",
+            repo=repo.full_name,
+            branch=branch,
+            file_count=len(files),
+            commit=new_commit.sha,
+        )
+
+        return {
+            "success": True,
+            "commit_sha": new_commit.sha,
+            "files_created": len(files),
+        }
+
+    def lookup_default_branch(self, repo_name: str) -> "asyncio.Future[str]":
+        """
+        Start resolving a repository's default branch on a worker thread.
+        
+        Lets callers overlap the blocking lookup with work that never
+        yields, such as file generation; await the future for the name.
+        """
+        return asyncio.get_running_loop().run_in_executor(
+            None, self.default_branch, repo_name
+        )
+
+    def default_branch(self, repo_name: str) -> str:
+        """
+        Get a repository's default branch name.
+        
+        Blocking. Falls back to "main" if the lookup fails.
+        """
+        self._ensure_client()
+
+        try:
+            return self._get_repo(repo_name).default_branch
+        except GithubException as e:
+            logger.warning("default_branch_lookup_failed", repo=repo_name, error=str(e))
+            return "main"
+
     def _get_repo(self, repo_name: str) -> Repository:
         """Get repository by name, trying org then user."""
         try:
@@ -480,9 +872,21 @@ class GitHubService:
 
         try:
             repo = self._get_repo(repo_name)
-            workflow = repo.get_workflow(workflow_id)
-            
-            success = workflow.create_dispatch(ref, inputs or {})
+
+            # Dispatch through the pooled client: one request on a kept-alive
+            # connection instead of PyGithub's blocking workflow lookup and
+            # dispatch calls
+            response = await self._get_http_client().post(
+                f"{GITHUB_API_URL}/repos/{repo.full_name}"
+                f"/actions/workflows/{workflow_id}/dispatches",
+                json={"ref": ref, "inputs": inputs or {}},
+                headers={
+                    "Authorization": f"bearer {self.token}",
+                    "Accept": "application/vnd.github+json",
+                },
+            )
+            response.raise_for_status()
+            success = response.status_code == 204
 
             logger.info(
                 "workflow_triggered",
@@ -497,7 +901,7 @@ class GitHubService:
                 "ref": ref,
             }
 
-        except GithubException as e:
+        except (GithubException, httpx.HTTPError) as e:
             logger.error("workflow_trigger_failed", error=str(e))
             return {
                 "success": False,
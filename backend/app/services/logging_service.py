@@ -5,8 +5,9 @@ Provides structured logging to the database for game generation progress.
 """
 
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +22,25 @@ class LoggingService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self._buffered = False
+
+    @asynccontextmanager
+    async def buffered(self) -> AsyncIterator[None]:
+        """
+        Defer log writes until the end of the block.
+        
+        Entries are added to the session without a flush per call, so any
+        commit inside the block, or the commit on exit, writes them together
+        in one batched INSERT. Error-level entries are still flushed
+        immediately. Leaving the block normally commits the session, so
+        entries added after the caller's last commit are not lost.
+        """
+        self._buffered = True
+        try:
+            yield
+        finally:
+            self._buffered = False
+        await self.db.commit()
 
     async def log(
         self,
@@ -55,7 +75,8 @@ class LoggingService:
         )
         
         self.db.add(log_entry)
-        await self.db.flush()
+        if not self._buffered or level == "error":
+            await self.db.flush()
         
         # Also log to structlog for terminal output
         log_func = getattr(logger, level, logger.info)
@@ -42,7 +42,9 @@ celery_app.conf.update(
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     
-    # Concurrency
+    # Concurrency. Step tasks run for minutes, so each worker process
+    # reserves only the task it is running; prefetching more would leave
+    # queued steps stuck behind a long one while other processes idle.
     worker_prefetch_multiplier=1,
     worker_concurrency=4,
     
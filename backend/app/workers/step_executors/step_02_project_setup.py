@@ -82,7 +82,7 @@ class ProjectSetupStep(BaseStepExecutor):
 
             # Step 2.2: Create project structure
             logs.append("\n--- Creating Project Structure ---")
-            package_name = f"com.gamefactory.{game.slug.replace('-', '_')}"
+            package_name = game.app_id
             
             structure_result = await self.template_service.create_project_structure(
                 target_path=str(project_path),
@@ -8,10 +8,12 @@ Generates all 10 level configurations with:
 - Level regression tests
 """
 
+from pathlib import Path
 from typing import Any, Dict, List
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 
 from app.models.game import Game
 from app.services.ai_service import get_ai_service
@@ -20,6 +22,20 @@ from app.workers.step_executors.base import BaseStepExecutor
 
 logger = structlog.get_logger()
 
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+# Game-independent screen, loaded once at import
+_LEVEL_SELECT_SCREEN = (TEMPLATE_DIR / "level_select_screen.dart").read_text(encoding="utf-8")
+
+# Levels generated per game, by the AI or the fallback
+_LEVEL_COUNT = 10
+
+# Background theme per level number (1-indexed)
+_LEVEL_THEMES = (
+    "meadow", "meadow", "forest", "forest", "mountain",
+    "mountain", "cave", "cave", "sky", "sky",
+)
+
 
 class ContentProductionStep(BaseStepExecutor):
     """
@@ -58,11 +74,17 @@ class ContentProductionStep(BaseStepExecutor):
             logs.append("\n--- Generating Level Configurations ---")
             
             try:
-                levels = await self.ai_service.generate_level_configs(gdd, level_count=10)
+                levels = await self.ai_service.generate_level_configs(
+                    gdd, level_count=_LEVEL_COUNT
+                )
                 logs.append(f"✓ Generated {len(levels)} level configs via AI")
+                # Only a JSON true unlocks a level; strings like "false"
+                # are truthy and would ship paid levels unlocked
+                for level in levels:
+                    level["is_free"] = level.get("is_free") is True
             except Exception as e:
                 logs.append(f"⚠ AI generation failed: {e}, using fallback")
-                levels = self._generate_fallback_levels(game)
+                levels = self._generate_fallback_levels(game, level_count=_LEVEL_COUNT)
 
             # Generate files
             files = {}
@@ -77,7 +99,7 @@ class ContentProductionStep(BaseStepExecutor):
             logs.append("✓ Generated levels.json")
 
             # Level select screen
-            files["lib/ui/screens/level_select_screen.dart"] = self._generate_level_select(game)
+            files["lib/ui/screens/level_select_screen.dart"] = _LEVEL_SELECT_SCREEN
             logs.append("✓ Generated level select screen")
 
             # Level regression tests
@@ -105,10 +127,11 @@ class ContentProductionStep(BaseStepExecutor):
                     )
                 logs.append("✓ Committed files individually")
 
-            # Store levels in GDD
+            # Store levels in GDD; the orchestrator commits at the step boundary
             if game.gdd_spec:
                 game.gdd_spec["levels"] = levels
-                await db.commit()
+                flag_modified(game, "gdd_spec")
+                await db.flush()
 
             logs.append("\n--- Content Production Complete ---")
 
@@ -135,11 +158,12 @@ class ContentProductionStep(BaseStepExecutor):
                 "logs": "\n".join(logs),
             }
 
-    def _generate_fallback_levels(self, game: Game) -> List[Dict]:
+    def _generate_fallback_levels(self, game: Game, level_count: int) -> List[Dict]:
         """Generate fallback level configs."""
         levels = []
-        for i in range(1, 11):
-            difficulty = (i - 1) / 9.0  # 0.0 to 1.0
+        difficulty_step = 1.0 / max(level_count - 1, 1)
+        for i in range(1, level_count + 1):
+            difficulty = (i - 1) * difficulty_step  # 0.0 to 1.0
             
             levels.append({
                 "level_number": i,
@@ -163,9 +187,7 @@ class ContentProductionStep(BaseStepExecutor):
 
     def _get_theme_for_level(self, level: int) -> str:
         """Get background theme based on level."""
-        themes = ["meadow", "meadow", "forest", "forest", "mountain", 
-                  "mountain", "cave", "cave", "sky", "sky"]
-        return themes[level - 1] if level <= 10 else "sky"
+        return _LEVEL_THEMES[level - 1] if level <= len(_LEVEL_THEMES) else "sky"
 
     def _generate_levels_dart(self, levels: List[Dict], game: Game) -> str:
         """Generate Dart level configuration file."""
@@ -218,7 +240,7 @@ class LevelConfigs {
             code += f'''    LevelConfig(
       levelNumber: {level["level_number"]},
       name: '{level.get("name", f"Level {level['level_number']}")}',
-      isFree: {str(level.get("is_free", False)).lower()},
+      isFree: {"true" if level.get("is_free") else "false"},
       unlockRequirement: '{level.get("unlock_requirement", "rewarded_ad")}',
       difficulty: {level.get("difficulty", 0.5)},
       timeLimitSeconds: {time_str},
@@ -251,136 +273,6 @@ class LevelConfigs {
 '''
         return code
 
-    def _generate_level_select(self, game: Game) -> str:
-        """Generate level select screen."""
-        return '''import 'package:flutter/material.dart';
-import 'package:provider/provider.dart';
-import '../../services/storage_service.dart';
-import '../../services/audio_service.dart';
-import '../../config/levels.dart';
-import 'game_screen.dart';
-
-class LevelSelectScreen extends StatelessWidget {
-  const LevelSelectScreen({super.key});
-
-  @override
-  Widget build(BuildContext context) {
-    final storage = Provider.of<StorageService>(context, listen: false);
-    final unlockedLevels = storage.getUnlockedLevels();
-
-    return Scaffold(
-      appBar: AppBar(
-        title: const Text('Select Level'),
-        backgroundColor: const Color(0xFF1A1A2E),
-      ),
-      body: Container(
-        decoration: const BoxDecoration(
-          gradient: LinearGradient(
-            begin: Alignment.topCenter,
-            end: Alignment.bottomCenter,
-            colors: [Color(0xFF1A1A2E), Color(0xFF16213E)],
-          ),
-        ),
-        child: GridView.builder(
-          padding: const EdgeInsets.all(16),
-          gridDelegate: const SliverGridDelegateWithFixedCrossAxisCount(
-            crossAxisCount: 3,
-            mainAxisSpacing: 16,
-            crossAxisSpacing: 16,
-          ),
-          itemCount: LevelConfigs.totalLevels,
-          itemBuilder: (context, index) {
-            final level = LevelConfigs.levels[index];
-            final isUnlocked = unlockedLevels.contains(level.levelNumber);
-            final highScore = storage.getHighScores()[level.levelNumber] ?? 0;
-
-            return _LevelTile(
-              level: level,
-              isUnlocked: isUnlocked,
-              highScore: highScore,
-              onTap: isUnlocked
-                  ? () {
-                      AudioService().playSound('button');
-                      Navigator.push(
-                        context,
-                        MaterialPageRoute(
-                          builder: (_) => GameScreen(initialLevel: level.levelNumber),
-                        ),
-                      );
-                    }
-                  : null,
-            );
-          },
-        ),
-      ),
-    );
-  }
-}
-
-class _LevelTile extends StatelessWidget {
-  final LevelConfig level;
-  final bool isUnlocked;
-  final int highScore;
-  final VoidCallback? onTap;
-
-  const _LevelTile({
-    required this.level,
-    required this.isUnlocked,
-    required this.highScore,
-    this.onTap,
-  });
-
-  @override
-  Widget build(BuildContext context) {
-    return GestureDetector(
-      onTap: onTap,
-      child: Container(
-        decoration: BoxDecoration(
-          color: isUnlocked ? Colors.deepPurple : Colors.grey[800],
-          borderRadius: BorderRadius.circular(12),
-          border: level.isFree
-              ? Border.all(color: Colors.amber, width: 2)
-              : null,
-          boxShadow: isUnlocked
-              ? [
-                  BoxShadow(
-                    color: Colors.deepPurple.withOpacity(0.3),
-                    blurRadius: 8,
-                    offset: const Offset(0, 4),
-                  ),
-                ]
-              : null,
-        ),
-        child: Column(
-          mainAxisAlignment: MainAxisAlignment.center,
-          children: [
-            if (isUnlocked) ...[
-              Text(
-                '${level.levelNumber}',
-                style: const TextStyle(
-                  color: Colors.white,
-                  fontSize: 28,
-                  fontWeight: FontWeight.bold,
-                ),
-              ),
-              if (highScore > 0)
-                Text(
-                  '⭐ $highScore',
-                  style: const TextStyle(
-                    color: Colors.amber,
-                    fontSize: 12,
-                  ),
-                ),
-            ] else
-              const Icon(Icons.lock, color: Colors.white54, size: 32),
-          ],
-        ),
-      ),
-    );
-  }
-}
-'''
-
     def _generate_level_tests(self, game: Game) -> str:
         """Generate level regression tests."""
         return f'''import 'package:flutter_test/flutter_test.dart';
@@ -452,15 +344,15 @@ void main() {{
         artifacts: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Validate content production."""
+        levels = artifacts.get("levels", [])
+        free_count = sum(1 for l in levels if l.get("is_free"))
+
         errors = []
         warnings = []
 
-        levels = artifacts.get("levels", [])
-
-        if len(levels) != 10:
-            errors.append(f"Expected 10 levels, got {len(levels)}")
+        if len(levels) != _LEVEL_COUNT:
+            errors.append(f"Expected {_LEVEL_COUNT} levels, got {len(levels)}")
 
-        free_count = sum(1 for l in levels if l.get("is_free"))
         if free_count != 3:
             warnings.append(f"Expected 3 free levels, got {free_count}")
 
@@ -471,8 +363,9 @@ void main() {{
         }
 
     async def rollback(self, db: AsyncSession, game: Game) -> bool:
-        """Rollback content production."""
+        """Rollback content production. The caller owns the transaction."""
         if game.gdd_spec and "levels" in game.gdd_spec:
             del game.gdd_spec["levels"]
-            await db.commit()
+            flag_modified(game, "gdd_spec")
+            await db.flush()
         return True
@@ -8,7 +8,9 @@ Prepares the game for release:
 - Release checklist verification
 """
 
-from typing import Any, Dict
+import functools
+import string
+from typing import Any, Dict, Final, Optional, Sequence
 
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,119 +21,8 @@ from app.workers.step_executors.base import BaseStepExecutor
 
 logger = structlog.get_logger()
 
-
-class ReleasePrepStep(BaseStepExecutor):
-    """
-    Step 11: Prepare for release.
-    
-    Optimizes performance, configures build signing,
-    and generates store metadata.
-    """
-
-    step_number = 11
-    step_name = "release_prep"
-
-    def __init__(self):
-        super().__init__()
-        self.github_service = get_github_service()
-
-    async def execute(self, db: AsyncSession, game: Game) -> Dict[str, Any]:
-        """Execute release preparation."""
-        self.logger.info("preparing_release", game_id=str(game.id))
-
-        logs = []
-        logs.append(f"Starting release preparation for {game.name}")
-
-        try:
-            if not game.github_repo:
-                return {
-                    "success": False,
-                    "error": "Missing GitHub repo",
-                    "logs": "\n".join(logs),
-                }
-
-            files = {}
-
-            # Performance optimization config
-            logs.append("\n--- Performance Optimization ---")
-            files["lib/config/performance.dart"] = self._generate_performance_config(game)
-            logs.append("✓ Generated performance configuration")
-
-            # ProGuard rules for release builds
-            files["android/app/proguard-rules.pro"] = self._generate_proguard_rules()
-            logs.append("✓ Generated ProGuard rules")
-
-            # Build configuration for signing
-            files["android/app/build.gradle"] = self._generate_build_gradle(game)
-            logs.append("✓ Updated build.gradle")
-
-            # GitHub Actions release workflow
-            files[".github/workflows/release.yml"] = self._generate_release_workflow(game)
-            logs.append("✓ Generated release workflow")
-
-            # Play Store metadata
-            logs.append("\n--- Store Metadata ---")
-            files["fastlane/metadata/android/en-US/full_description.txt"] = self._generate_full_description(game)
-            files["fastlane/metadata/android/en-US/short_description.txt"] = self._generate_short_description(game)
-            files["fastlane/metadata/android/en-US/title.txt"] = game.name
-            logs.append("✓ Generated Play Store metadata")
-
-            # Release checklist
-            files["docs/RELEASE_CHECKLIST.md"] = self._generate_release_checklist(game)
-            logs.append("✓ Generated release checklist")
-
-            # Privacy policy placeholder
-            files["docs/PRIVACY_POLICY.md"] = self._generate_privacy_policy(game)
-            logs.append("✓ Generated privacy policy template")
-
-            # Commit to GitHub
-            logs.append("\n--- Committing to GitHub ---")
-            
-            commit_result = await self.github_service.create_multiple_files(
-                repo_name=game.github_repo,
-                files=files,
-                commit_message="Step 11: Add release preparation files",
-            )
-
-            if commit_result["success"]:
-                logs.append(f"✓ Committed {len(files)} files")
-            else:
-                for path, content in files.items():
-                    await self.github_service.create_file(
-                        repo_name=game.github_repo,
-                        file_path=path,
-                        content=content,
-                        commit_message=f"Add {path}",
-                    )
-                logs.append("✓ Committed files individually")
-
-            logs.append("\n--- Release Preparation Complete ---")
-
-            validation = await self.validate(db, game, {"files": list(files.keys())})
-
-            return {
-                "success": validation["valid"],
-                "artifacts": {
-                    "files_created": list(files.keys()),
-                    "store_metadata": True,
-                    "release_workflow": True,
-                },
-                "validation": validation,
-                "logs": "\n".join(logs),
-            }
-
-        except Exception as e:
-            self.logger.exception("release_prep_failed", error=str(e))
-            logs.append(f"\n✗ Error: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "logs": "\n".join(logs),
-            }
-
-    def _generate_performance_config(self, game: Game) -> str:
-        """Generate performance optimization configuration."""
-        return '''/// Performance configuration
+# Performance tuning constants - identical for every game
+_PERFORMANCE_CONFIG_DART: Final[bytes] = b'''/// Performance configuration
 /// 
 /// Controls game performance settings for different device capabilities.
 
@@ -175,9 +66,8 @@ class PerformanceConfig {
 }
 '''
 
-    def _generate_proguard_rules(self) -> str:
-        """Generate ProGuard rules for release builds."""
-        return '''# Flutter-specific rules
+# ProGuard rules for release builds
+_PROGUARD_RULES: Final[bytes] = b'''# Flutter-specific rules
 -keep class io.flutter.app.** { *; }
 -keep class io.flutter.plugin.**  { *; }
 -keep class io.flutter.util.**  { *; }
@@ -219,101 +109,8 @@ class PerformanceConfig {
 -keepattributes SourceFile,LineNumberTable
 '''
 
-    def _generate_build_gradle(self, game: Game) -> str:
-        """Generate Android build.gradle with signing configuration."""
-        app_id = f"com.gamefactory.{game.slug.replace('-', '_')}"
-        return f'''plugins {{
-    id "com.android.application"
-    id "kotlin-android"
-    id "dev.flutter.flutter-gradle-plugin"
-    id "com.google.gms.google-services"
-}}
-
-def localProperties = new Properties()
-def localPropertiesFile = rootProject.file('local.properties')
-if (localPropertiesFile.exists()) {{
-    localPropertiesFile.withReader('UTF-8') {{ reader ->
-        localProperties.load(reader)
-    }}
-}}
-
-def flutterVersionCode = localProperties.getProperty('flutter.versionCode')
-if (flutterVersionCode == null) {{
-    flutterVersionCode = '1'
-}}
-
-def flutterVersionName = localProperties.getProperty('flutter.versionName')
-if (flutterVersionName == null) {{
-    flutterVersionName = '1.0.0'
-}}
-
-def keystoreProperties = new Properties()
-def keystorePropertiesFile = rootProject.file('key.properties')
-if (keystorePropertiesFile.exists()) {{
-    keystoreProperties.load(new FileInputStream(keystorePropertiesFile))
-}}
-
-android {{
-    namespace "{app_id}"
-    compileSdkVersion flutter.compileSdkVersion
-    ndkVersion flutter.ndkVersion
-
-    compileOptions {{
-        sourceCompatibility JavaVersion.VERSION_1_8
-        targetCompatibility JavaVersion.VERSION_1_8
-    }}
-
-    kotlinOptions {{
-        jvmTarget = '1.8'
-    }}
-
-    defaultConfig {{
-        applicationId "{app_id}"
-        minSdkVersion 21
-        targetSdkVersion flutter.targetSdkVersion
-        versionCode flutterVersionCode.toInteger()
-        versionName flutterVersionName
-        multiDexEnabled true
-    }}
-
-    signingConfigs {{
-        release {{
-            if (keystorePropertiesFile.exists()) {{
-                keyAlias keystoreProperties['keyAlias']
-                keyPassword keystoreProperties['keyPassword']
-                storeFile file(keystoreProperties['storeFile'])
-                storePassword keystoreProperties['storePassword']
-            }}
-        }}
-    }}
-
-    buildTypes {{
-        release {{
-            signingConfig signingConfigs.release
-            minifyEnabled true
-            shrinkResources true
-            proguardFiles getDefaultProguardFile('proguard-android-optimize.txt'), 'proguard-rules.pro'
-        }}
-        debug {{
-            signingConfig signingConfigs.debug
-        }}
-    }}
-}}
-
-flutter {{
-    source '../..'
-}}
-
-dependencies {{
-    implementation 'com.google.android.gms:play-services-ads:22.6.0'
-    implementation platform('com.google.firebase:firebase-bom:32.7.0')
-    implementation 'com.google.firebase:firebase-analytics'
-}}
-'''
-
-    def _generate_release_workflow(self, game: Game) -> str:
-        """Generate GitHub Actions release workflow."""
-        return f'''name: Release Build
+# GitHub Actions release workflow
+_RELEASE_WORKFLOW_YAML: Final[bytes] = b'''name: Release Build
 
 on:
   push:
@@ -348,15 +145,15 @@ jobs:
       
       - name: Decode keystore
         env:
-          KEYSTORE_BASE64: ${{{{ secrets.KEYSTORE_BASE64 }}}}
+          KEYSTORE_BASE64: ${{ secrets.KEYSTORE_BASE64 }}
         run: |
           echo "$KEYSTORE_BASE64" | base64 --decode > android/app/release.keystore
           
       - name: Create key.properties
         env:
-          KEY_ALIAS: ${{{{ secrets.KEY_ALIAS }}}}
-          KEY_PASSWORD: ${{{{ secrets.KEY_PASSWORD }}}}
-          STORE_PASSWORD: ${{{{ secrets.STORE_PASSWORD }}}}
+          KEY_ALIAS: ${{ secrets.KEY_ALIAS }}
+          KEY_PASSWORD: ${{ secrets.KEY_PASSWORD }}
+          STORE_PASSWORD: ${{ secrets.STORE_PASSWORD }}
         run: |
           echo "storePassword=$STORE_PASSWORD" >> android/key.properties
           echo "keyPassword=$KEY_PASSWORD" >> android/key.properties
@@ -391,12 +188,124 @@ jobs:
           generate_release_notes: true
 '''
 
-    def _generate_full_description(self, game: Game) -> str:
-        """Generate full Play Store description."""
-        gdd = game.gdd_spec or {}
-        tagline = gdd.get("tagline", "An exciting mobile game!")
-        
-        return f'''{game.name} - {tagline}
+
+# Progress log for file generation, in commit order, ending with the
+# commit header; the lines never vary so they are one block
+_GENERATION_LOG: Final[str] = """
+--- Performance Optimization ---
+✓ Generated performance configuration
+✓ Generated ProGuard rules
+✓ Updated build.gradle
+✓ Generated release workflow
+
+--- Store Metadata ---
+✓ Generated Play Store metadata
+✓ Generated release checklist
+✓ Generated privacy policy template
+
+--- Committing to GitHub ---"""
+
+# Android build.gradle with release signing; $app_id is the application id
+_BUILD_GRADLE_TPL = string.Template('''plugins {
+    id "com.android.application"
+    id "kotlin-android"
+    id "dev.flutter.flutter-gradle-plugin"
+    id "com.google.gms.google-services"
+}
+
+def localProperties = new Properties()
+def localPropertiesFile = rootProject.file('local.properties')
+if (localPropertiesFile.exists()) {
+    localPropertiesFile.withReader('UTF-8') { reader ->
+        localProperties.load(reader)
+    }
+}
+
+def flutterVersionCode = localProperties.getProperty('flutter.versionCode')
+if (flutterVersionCode == null) {
+    flutterVersionCode = '1'
+}
+
+def flutterVersionName = localProperties.getProperty('flutter.versionName')
+if (flutterVersionName == null) {
+    flutterVersionName = '1.0.0'
+}
+
+def keystoreProperties = new Properties()
+def keystorePropertiesFile = rootProject.file('key.properties')
+if (keystorePropertiesFile.exists()) {
+    keystoreProperties.load(new FileInputStream(keystorePropertiesFile))
+}
+
+android {
+    namespace "$app_id"
+    compileSdkVersion flutter.compileSdkVersion
+    ndkVersion flutter.ndkVersion
+
+    compileOptions {
+        sourceCompatibility JavaVersion.VERSION_1_8
+        targetCompatibility JavaVersion.VERSION_1_8
+    }
+
+    kotlinOptions {
+        jvmTarget = '1.8'
+    }
+
+    defaultConfig {
+        applicationId "$app_id"
+        minSdkVersion 21
+        targetSdkVersion flutter.targetSdkVersion
+        versionCode flutterVersionCode.toInteger()
+        versionName flutterVersionName
+        multiDexEnabled true
+    }
+
+    signingConfigs {
+        release {
+            if (keystorePropertiesFile.exists()) {
+                keyAlias keystoreProperties['keyAlias']
+                keyPassword keystoreProperties['keyPassword']
+                storeFile file(keystoreProperties['storeFile'])
+                storePassword keystoreProperties['storePassword']
+            }
+        }
+    }
+
+    buildTypes {
+        release {
+            signingConfig signingConfigs.release
+            minifyEnabled true
+            shrinkResources true
+            proguardFiles getDefaultProguardFile('proguard-android-optimize.txt'), 'proguard-rules.pro'
+        }
+        debug {
+            signingConfig signingConfigs.debug
+        }
+    }
+}
+
+flutter {
+    source '../..'
+}
+
+dependencies {
+    implementation 'com.google.android.gms:play-services-ads:22.6.0'
+    implementation platform('com.google.firebase:firebase-bom:32.7.0')
+    implementation 'com.google.firebase:firebase-analytics'
+}
+''')
+
+
+@functools.lru_cache(maxsize=256)
+def _build_gradle(app_id: str) -> bytes:
+    """Build the Android build.gradle for an application id."""
+    return _BUILD_GRADLE_TPL.substitute(app_id=app_id).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _full_description(name: str, tagline: str) -> bytes:
+    """Build the full Play Store description."""
+    return f'''{name} - {tagline}
 
 🎮 FEATURES
 
@@ -422,16 +331,11 @@ Test your skills across 10 challenging levels! Start with the basics and work yo
 Having issues or feedback? Contact us at support@gamefactory.com
 
 Made with ❤️ by GameFactory
-'''
+'''.encode("utf-8")
 
-    def _generate_short_description(self, game: Game) -> str:
-        """Generate short Play Store description."""
-        gdd = game.gdd_spec or {}
-        return gdd.get("tagline", f"Play {game.name} - an exciting mobile game!")[:80]
 
-    def _generate_release_checklist(self, game: Game) -> str:
-        """Generate release checklist."""
-        return f'''# Release Checklist for {game.name}
+# Release checklist; $name is the game name
+_RELEASE_CHECKLIST_TPL = string.Template('''# Release Checklist for $name
 
 ## Pre-Release
 
@@ -491,17 +395,23 @@ Made with ❤️ by GameFactory
 - [ ] Check analytics dashboard
 - [ ] Respond to reviews
 - [ ] Plan next update
-'''
+''')
 
-    def _generate_privacy_policy(self, game: Game) -> str:
-        """Generate privacy policy template."""
-        return f'''# Privacy Policy for {game.name}
+
+@functools.lru_cache(maxsize=256)
+def _release_checklist(name: str) -> bytes:
+    """Build the release checklist for a game."""
+    return _RELEASE_CHECKLIST_TPL.substitute(name=name).encode("utf-8")
+
+
+# Privacy policy template; $name is the game name
+_PRIVACY_POLICY_TPL = string.Template('''# Privacy Policy for $name
 
 *Last updated: [DATE]*
 
 ## Overview
 
-This privacy policy explains how {game.name} ("the App") collects, uses, and protects your information.
+This privacy policy explains how $name ("the App") collects, uses, and protects your information.
 
 ## Information We Collect
 
@@ -551,7 +461,152 @@ privacy@gamefactory.com
 ## Changes
 
 We may update this policy. Changes will be posted here with an updated date.
-'''
+''')
+
+
+@functools.lru_cache(maxsize=256)
+def _privacy_policy(name: str) -> bytes:
+    """Build the privacy policy template for a game."""
+    return _PRIVACY_POLICY_TPL.substitute(name=name).encode("utf-8")
+
+
+class ReleasePrepStep(BaseStepExecutor):
+    """
+    Step 11: Prepare for release.
+    
+    Optimizes performance, configures build signing,
+    and generates store metadata.
+    """
+
+    step_number = 11
+    step_name = "release_prep"
+
+    def __init__(self):
+        super().__init__()
+        self.github_service = get_github_service()
+
+    async def execute(self, db: AsyncSession, game: Game) -> Dict[str, Any]:
+        """Execute release preparation."""
+        # The base logger already carries the step; add the game once
+        log = self.logger.bind(game_id=str(game.id))
+        log.info("preparing_release")
+
+        logs = [f"Starting release preparation for {game.name}"]
+
+        try:
+            if not game.github_repo:
+                return {
+                    "success": False,
+                    "error": "Missing GitHub repo",
+                    "logs": "\n".join(logs),
+                }
+
+            branch_future = self.github_service.lookup_default_branch(game.github_repo)
+
+            # Read the GDD once; both store descriptions need the tagline
+            tagline = (game.gdd_spec or {}).get("tagline")
+
+            files = {
+                "lib/config/performance.dart": self._generate_performance_config(),
+                "android/app/proguard-rules.pro": self._generate_proguard_rules(),
+                "android/app/build.gradle": self._generate_build_gradle(game),
+                ".github/workflows/release.yml": self._generate_release_workflow(),
+                "fastlane/metadata/android/en-US/full_description.txt": (
+                    self._generate_full_description(game, tagline)
+                ),
+                "fastlane/metadata/android/en-US/short_description.txt": (
+                    self._generate_short_description(game, tagline)
+                ),
+                "fastlane/metadata/android/en-US/title.txt": self._generate_title(game),
+                "docs/RELEASE_CHECKLIST.md": self._generate_release_checklist(game),
+                "docs/PRIVACY_POLICY.md": self._generate_privacy_policy(game),
+            }
+            logs.append(_GENERATION_LOG)
+
+            # Commit to GitHub
+            commit_result = await self.github_service.commit_files_if_changed(
+                game.github_repo,
+                files,
+                "Step 11: Add release preparation files",
+                branch=await branch_future,
+            )
+            if not commit_result["success"]:
+                raise RuntimeError(
+                    f"Failed to commit release files: {commit_result.get('error')}"
+                )
+
+            if commit_result.get("skipped"):
+                logs.append("✓ Release files already committed, skipping commit")
+            elif commit_result.get("fallback"):
+                logs.append(f"✓ Committed {len(files)} files via Git Data API")
+            else:
+                logs.append(f"✓ Committed {len(files)} files")
+
+            logs.append("\n--- Release Preparation Complete ---")
+
+            file_paths = list(files)
+            validation = self._validate_files(file_paths)
+
+            return {
+                "success": validation["valid"],
+                "artifacts": {
+                    "files_created": file_paths,
+                    "store_metadata": True,
+                    "release_workflow": True,
+                },
+                "validation": validation,
+                "logs": "\n".join(logs),
+            }
+
+        except Exception as e:
+            error = str(e)
+            log.exception("release_prep_failed", error=error)
+            logs.append(f"\n✗ Error: {error}")
+            return {
+                "success": False,
+                "error": error,
+                "logs": "\n".join(logs),
+            }
+
+    def _generate_performance_config(self) -> bytes:
+        """Generate performance optimization configuration."""
+        return _PERFORMANCE_CONFIG_DART
+
+    def _generate_proguard_rules(self) -> bytes:
+        """Generate ProGuard rules for release builds."""
+        return _PROGUARD_RULES
+
+    def _generate_build_gradle(self, game: Game) -> bytes:
+        """Generate Android build.gradle with signing configuration."""
+        return _build_gradle(game.app_id)
+
+    def _generate_release_workflow(self) -> bytes:
+        """Generate GitHub Actions release workflow."""
+        return _RELEASE_WORKFLOW_YAML
+
+    def _generate_full_description(self, game: Game, tagline: Optional[str]) -> bytes:
+        """Generate full Play Store description."""
+        if tagline is None:
+            tagline = "An exciting mobile game!"
+        return _full_description(game.name, tagline)
+
+    def _generate_short_description(self, game: Game, tagline: Optional[str]) -> bytes:
+        """Generate short Play Store description."""
+        if tagline is None:
+            tagline = f"Play {game.name} - an exciting mobile game!"
+        return tagline[:80].encode("utf-8")
+
+    def _generate_title(self, game: Game) -> bytes:
+        """Generate Play Store title."""
+        return game.name.encode("utf-8")
+
+    def _generate_release_checklist(self, game: Game) -> bytes:
+        """Generate release checklist."""
+        return _release_checklist(game.name)
+
+    def _generate_privacy_policy(self, game: Game) -> bytes:
+        """Generate privacy policy template."""
+        return _privacy_policy(game.name)
 
     async def validate(
         self,
@@ -560,14 +615,19 @@ We may update this policy. Changes will be posted here with an updated date.
         artifacts: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Validate release preparation."""
+        return self._validate_files(artifacts.get("files", []))
+
+    def _validate_files(self, files: Sequence[str]) -> Dict[str, Any]:
+        """Check the written file list for the release essentials."""
         errors = []
         warnings = []
 
-        files = artifacts.get("files", [])
+        # One joined haystack instead of scanning every path per keyword
+        haystack = "\n".join(files)
 
         required = ["RELEASE_CHECKLIST", "proguard", "release.yml"]
         for req in required:
-            if not any(req in f for f in files):
+            if req not in haystack:
                 warnings.append(f"Missing: {req}")
 
         return {
@@ -8,13 +8,17 @@ Handles post-launch activities:
 - Generate constraints for future batches
 """
 
+import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 import structlog
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, case, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 
 from app.models.game import Game
 from app.models.analytics import AnalyticsEvent, GameMetrics
@@ -23,6 +27,83 @@ from app.workers.step_executors.base import BaseStepExecutor
 
 logger = structlog.get_logger()
 
+# Seconds the top/bottom mechanic names are reused across games
+_MECHANIC_BUCKETS_TTL = 60.0
+
+# (fetched_at, (top_names, poor_names)) from the last bucket query
+_mechanic_buckets_cache: Optional[Tuple[float, Tuple[Tuple[str, ...], Tuple[str, ...]]]] = None
+
+# Statements are built once at import; per-call values are bound parameters
+
+_game_window = (
+    AnalyticsEvent.game_id == bindparam("game_id"),
+    AnalyticsEvent.received_at >= bindparam("since"),
+)
+
+# Event counts per type, aggregated by Postgres
+_EVENT_COUNTS_STMT = (
+    select(
+        AnalyticsEvent.event_type,
+        func.count().label("count"),
+    )
+    .where(*_game_window)
+    .group_by(AnalyticsEvent.event_type)
+)
+
+
+def _json_number(key: str):
+    """
+    A numeric event property as float, NULL unless the JSON value is a number.
+    
+    Client-supplied properties may hold strings; guarding the cast keeps one
+    malformed event from failing the whole aggregate.
+    """
+    value = AnalyticsEvent.properties[key]
+    return case(
+        (func.json_typeof(value) == "number", value.as_float()),
+        else_=None,
+    )
+
+
+# Scores, session lengths, unique users and retention proxy
+_score = _json_number("score")
+_session_duration = _json_number("session_duration")
+_level = _json_number("level")
+_is_level_complete = AnalyticsEvent.event_type == "level_complete"
+
+_EVENT_AGGREGATES_STMT = (
+    select(
+        func.avg(_score).filter(_is_level_complete, _score != 0).label("average_score"),
+        func.avg(_session_duration).label("average_session_length"),
+        func.count(func.distinct(AnalyticsEvent.user_id)).label("unique_users"),
+        func.count().filter(_is_level_complete, _level >= 3).label("level_3_plus"),
+    )
+    .where(*_game_window)
+)
+
+# Top and bottom mechanics; only the names are needed, the weight
+# restores per-bucket order after the UNION ALL
+_MECHANIC_BUCKETS_STMT = union_all(
+    select(
+        literal("top").label("bucket"),
+        LearningWeight.mechanic_name,
+        LearningWeight.weight,
+    )
+    .where(LearningWeight.weight >= 1.2)
+    .where(LearningWeight.sample_count >= 3)
+    .order_by(LearningWeight.weight.desc())
+    .limit(5),
+    select(
+        literal("poor").label("bucket"),
+        LearningWeight.mechanic_name,
+        LearningWeight.weight,
+    )
+    .where(LearningWeight.weight <= 0.5)
+    .where(LearningWeight.sample_count >= 3)
+    .order_by(LearningWeight.weight.asc())
+    .limit(3),
+)
+
 
 class PostLaunchStep(BaseStepExecutor):
     """
@@ -41,10 +122,13 @@ class PostLaunchStep(BaseStepExecutor):
         logs = []
         logs.append(f"Starting post-launch analytics for {game.name}")
 
+        # One timestamp for the analytics window and the completion time
+        now = datetime.utcnow()
+
         try:
             # Aggregate analytics
             logs.append("\n--- Aggregating Analytics ---")
-            metrics = await self._aggregate_analytics(db, game.id)
+            metrics = await self._aggregate_analytics(db, game.id, now)
             logs.append(f"✓ Processed {metrics.get('total_events', 0)} events")
 
             # Calculate game score
@@ -52,6 +136,22 @@ class PostLaunchStep(BaseStepExecutor):
             score = self._calculate_game_score(metrics)
             logs.append(f"✓ Game score: {score:.2f}")
 
+            # Without events there is nothing to learn from; storing metrics
+            # or moving weights would only record the zero-data defaults
+            if metrics["total_events"] == 0:
+                logs.append("\n⚠ No events recorded, skipping learning update")
+                validation = await self.validate(db, game, {"metrics": metrics, "score": score})
+                return {
+                    "success": validation["valid"],
+                    "artifacts": {
+                        "game_score": score,
+                        "metrics": metrics,
+                        "constraints": [],
+                    },
+                    "validation": validation,
+                    "logs": "\n".join(logs),
+                }
+
             # Store metrics
             await self._store_metrics(db, game.id, metrics, score)
             logs.append("✓ Metrics stored in database")
@@ -63,18 +163,30 @@ class PostLaunchStep(BaseStepExecutor):
 
             # Generate next-batch constraints
             logs.append("\n--- Generating Batch Constraints ---")
-            constraints = await self._generate_constraints(db, game, metrics)
+            constraints = await self._generate_constraints(db, game, metrics, score)
             logs.append(f"✓ Generated {len(constraints)} constraints")
 
-            # Store constraints in game record
+            # Store constraints in game record, skipping the JSON rewrite
+            # when a rerun produced the same results
             if game.gdd_spec:
-                game.gdd_spec["post_launch_metrics"] = {
-                    "score": score,
-                    "metrics": metrics,
-                    "constraints_generated": constraints,
-                    "completed_at": datetime.utcnow().isoformat(),
-                }
-                await db.commit()
+                previous = game.gdd_spec.get("post_launch_metrics") or {}
+                unchanged = (
+                    previous.get("score") == score
+                    and previous.get("metrics") == metrics
+                    and previous.get("constraints_generated") == constraints
+                )
+                if not unchanged:
+                    game.gdd_spec["post_launch_metrics"] = {
+                        "score": score,
+                        "metrics": metrics,
+                        "constraints_generated": constraints,
+                        "completed_at": now.isoformat(),
+                    }
+                    # In-place changes to a plain JSON column are not tracked
+                    flag_modified(game, "gdd_spec")
+
+            # Metrics, weights and results land in a single transaction
+            await db.commit()
 
             logs.append("\n--- Post-Launch Complete ---")
 
@@ -104,43 +216,31 @@ class PostLaunchStep(BaseStepExecutor):
         self,
         db: AsyncSession,
         game_id: UUID,
+        now: datetime,
     ) -> Dict[str, Any]:
         """Aggregate analytics data for the game."""
-        
-        # Query analytics events
-        now = datetime.utcnow()
         since = now - timedelta(days=30)  # Last 30 days
-        
-        result = await db.execute(
-            select(AnalyticsEvent)
-            .where(AnalyticsEvent.game_id == game_id)
-            .where(AnalyticsEvent.received_at >= since)
-        )
-        events = result.scalars().all()
-
-        # Calculate metrics
-        total_events = len(events)
-        event_counts = {}
-        total_scores = []
-        session_durations = []
-        unique_users = set()  # Track unique user IDs for DAU
-        
-        for event in events:
-            event_counts[event.event_type] = event_counts.get(event.event_type, 0) + 1
-            
-            # Track unique users for DAU calculation
-            if event.user_id:
-                unique_users.add(event.user_id)
-            
-            # Collect scores from level_complete events
-            if event.event_type == "level_complete" and event.properties:
-                score = event.properties.get("score", 0)
-                if score:
-                    total_scores.append(score)
-            
-            # Collect session durations from game events
-            if event.properties and "session_duration" in event.properties:
-                session_durations.append(event.properties["session_duration"])
+        params = {"game_id": game_id, "since": since}
+
+        # The two scans are independent reads. A session cannot run two
+        # statements at once, so the second goes through a sibling
+        # session on the same engine.
+        async with AsyncSession(db.bind) as sibling:
+            # Let both finish before re-raising, so the sibling session is
+            # never closed under a statement still in flight
+            counts_result, aggregates_result = await asyncio.gather(
+                db.execute(_EVENT_COUNTS_STMT, params),
+                sibling.execute(_EVENT_AGGREGATES_STMT, params),
+                return_exceptions=True,
+            )
+            for result in (counts_result, aggregates_result):
+                if isinstance(result, BaseException):
+                    raise result
+            aggregates = aggregates_result.one()
+
+        # Consume the rows straight off the result, without an interim list
+        event_counts = {row.event_type: row.count for row in counts_result}
+        total_events = sum(event_counts.values())
 
         # Calculate key metrics
         game_starts = event_counts.get("game_start", 0)
@@ -155,18 +255,11 @@ class PostLaunchStep(BaseStepExecutor):
         fail_rate = level_fails / max(level_completes + level_fails, 1)
         ad_opt_in_rate = ad_completed / max(ad_shown, 1) if ad_shown > 0 else 0
 
-        # Calculate averages
-        average_score = sum(total_scores) / len(total_scores) if total_scores else 0
-        average_session_length = sum(session_durations) / len(session_durations) if session_durations else 0
+        average_score = float(aggregates.average_score or 0)
+        average_session_length = float(aggregates.average_session_length or 0)
 
-        # Calculate retention proxy (users who completed level 3+)
-        level_3_plus = sum(
-            1 for e in events 
-            if e.event_type == "level_complete" 
-            and e.properties
-            and e.properties.get("level", 0) >= 3
-        )
-        retention_proxy = level_3_plus / max(game_starts, 1)
+        # Retention proxy (users who completed level 3+)
+        retention_proxy = aggregates.level_3_plus / max(game_starts, 1)
 
         return {
             "total_events": total_events,
@@ -182,7 +275,7 @@ class PostLaunchStep(BaseStepExecutor):
             "retention_proxy": retention_proxy,
             "average_score": average_score,
             "average_session_length": average_session_length,
-            "unique_users": len(unique_users),  # DAU count
+            "unique_users": aggregates.unique_users,  # DAU count
             "period_days": 30,
         }
 
@@ -215,31 +308,44 @@ class PostLaunchStep(BaseStepExecutor):
         metrics: Dict[str, Any],
         score: float,
     ) -> None:
-        """Store aggregated metrics in database."""
+        """
+        Store aggregated metrics in database.
+        
+        A row for the game and date that already exists is overwritten, so
+        rerunning the step on the same day refreshes that day's metrics.
+        """
         from datetime import date as date_type
         
         today = date_type.today()
         
         # Use the GameMetrics model which is for daily aggregates
-        game_metrics = GameMetrics(
-            game_id=game_id,
-            date=today,
-            sessions=metrics.get("game_starts", 0),
-            dau=metrics.get("unique_users", 0),  # Daily active users from unique user IDs
-            avg_session_duration_seconds=int(metrics.get("average_session_length", 0)),
-            levels_completed=metrics.get("level_completes", 0),
-            levels_failed=metrics.get("level_fails", 0),
-            retention_d1=metrics.get("retention_proxy", 0),
-            retention_d7=0,  # Requires 7 days of data
-            retention_d30=0,  # Requires 30 days of data
-            ad_impressions=metrics.get("ad_shown", 0),
-            ad_revenue_cents=metrics.get("ad_completed", 0),  # $0.01 per completed ad
-            iap_revenue_cents=0,  # No IAP implemented yet
-            score=score,
-        )
+        row = {
+            "game_id": game_id,
+            "date": today,
+            "sessions": metrics.get("game_starts", 0),
+            "dau": metrics.get("unique_users", 0),  # Daily active users from unique user IDs
+            "avg_session_duration_seconds": int(metrics.get("average_session_length", 0)),
+            "levels_completed": metrics.get("level_completes", 0),
+            "levels_failed": metrics.get("level_fails", 0),
+            "retention_d1": metrics.get("retention_proxy", 0),
+            "retention_d7": 0,  # Requires 7 days of data
+            "retention_d30": 0,  # Requires 30 days of data
+            "ad_impressions": metrics.get("ad_shown", 0),
+            "ad_revenue_cents": metrics.get("ad_completed", 0),  # $0.01 per completed ad
+            "iap_revenue_cents": 0,  # No IAP implemented yet
+            "score": score,
+        }
 
-        db.add(game_metrics)
-        await db.commit()
+        stmt = insert(GameMetrics).values(row)
+        stmt = stmt.on_conflict_do_update(
+            constraint="unique_game_date",
+            set_={
+                column: stmt.excluded[column]
+                for column in row
+                if column not in ("game_id", "date")
+            },
+        )
+        await db.execute(stmt)
 
     async def _update_learning_weights(
         self,
@@ -263,91 +369,60 @@ class PostLaunchStep(BaseStepExecutor):
         else:
             weight_adjustment = -0.05  # Penalty
 
-        # Update weights for used mechanics
-        for mechanic_name in selected_mechanics + [primary_mechanic]:
-            if not mechanic_name:
-                continue
-
-            result = await db.execute(
-                select(LearningWeight)
-                .where(LearningWeight.mechanic_name == mechanic_name)
-            )
-            weight = result.scalar_one_or_none()
-
-            if weight:
-                weight.weight = max(0.1, min(2.0, weight.weight + weight_adjustment))
-                weight.sample_count += 1
-                weight.last_updated = datetime.utcnow()
-            else:
-                weight = LearningWeight(
-                    mechanic_name=mechanic_name,
-                    genre=game.genre,
-                    weight=1.0 + weight_adjustment,
-                    sample_count=1,
-                )
-                db.add(weight)
-
-        # Update genre weight
-        genre_weight_result = await db.execute(
-            select(LearningWeight)
-            .where(LearningWeight.mechanic_name == f"genre:{game.genre}")
+        genre_key = f"genre:{game.genre}"
+        # Unique, non-empty mechanic names in first-seen order
+        mechanic_names = [
+            name for name in dict.fromkeys(selected_mechanics + [primary_mechanic]) if name
+        ]
+
+        # Insert-or-adjust every weight this game touches in one atomic
+        # statement; genre weights keep a higher floor than mechanics
+        stmt = insert(LearningWeight).values([
+            {
+                "mechanic_name": name,
+                "genre": game.genre,
+                "weight": 1.0 + weight_adjustment,
+                "sample_count": 1,
+            }
+            for name in mechanic_names + [genre_key]
+        ])
+        floor = case((LearningWeight.mechanic_name == genre_key, 0.5), else_=0.1)
+        stmt = stmt.on_conflict_do_update(
+            constraint="unique_mechanic_name_genre",
+            set_={
+                "weight": func.greatest(
+                    floor, func.least(2.0, LearningWeight.weight + weight_adjustment)
+                ),
+                "sample_count": LearningWeight.sample_count + 1,
+                "last_updated": func.now(),
+            },
         )
-        genre_weight = genre_weight_result.scalar_one_or_none()
-
-        if genre_weight:
-            genre_weight.weight = max(0.5, min(2.0, genre_weight.weight + weight_adjustment))
-            genre_weight.sample_count += 1
-        else:
-            genre_weight = LearningWeight(
-                mechanic_name=f"genre:{game.genre}",
-                genre=game.genre,
-                weight=1.0 + weight_adjustment,
-                sample_count=1,
-            )
-            db.add(genre_weight)
-
-        await db.commit()
+        await db.execute(stmt)
 
     async def _generate_constraints(
         self,
         db: AsyncSession,
         game: Game,
         metrics: Dict[str, Any],
+        score: float,
     ) -> List[Dict[str, Any]]:
         """Generate constraints for the next batch."""
         constraints = []
 
-        # Get top-performing mechanics
-        result = await db.execute(
-            select(LearningWeight)
-            .where(LearningWeight.weight >= 1.2)
-            .where(LearningWeight.sample_count >= 3)
-            .order_by(LearningWeight.weight.desc())
-            .limit(5)
-        )
-        top_mechanics = result.scalars().all()
+        top_mechanics, poor_mechanics = await self._get_mechanic_buckets(db)
 
         if top_mechanics:
             constraints.append({
                 "type": "prefer_mechanics",
-                "value": [m.mechanic_name for m in top_mechanics],
+                "value": list(top_mechanics),
                 "reason": "High-performing mechanics from past games",
             })
 
-        # Get underperforming mechanics to avoid
-        result = await db.execute(
-            select(LearningWeight)
-            .where(LearningWeight.weight <= 0.5)
-            .where(LearningWeight.sample_count >= 3)
-            .order_by(LearningWeight.weight.asc())
-            .limit(3)
-        )
-        poor_mechanics = result.scalars().all()
-
+        # Avoid underperforming mechanics
         if poor_mechanics:
             constraints.append({
                 "type": "avoid_mechanics",
-                "value": [m.mechanic_name for m in poor_mechanics],
+                "value": list(poor_mechanics),
                 "reason": "Low-performing mechanics from past games",
             })
 
@@ -368,7 +443,6 @@ class PostLaunchStep(BaseStepExecutor):
             })
 
         # Genre preference based on score
-        score = self._calculate_game_score(metrics)
         if score >= 60:
             constraints.append({
                 "type": "prefer_genre",
@@ -378,6 +452,39 @@ class PostLaunchStep(BaseStepExecutor):
 
         return constraints
 
+    async def _get_mechanic_buckets(
+        self,
+        db: AsyncSession,
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Get the top and bottom mechanic names by learning weight.
+        
+        The lists are global and move slowly, so they are cached in-process
+        for _MECHANIC_BUCKETS_TTL seconds across games.
+        """
+        global _mechanic_buckets_cache
+
+        now = time.monotonic()
+        if _mechanic_buckets_cache and now - _mechanic_buckets_cache[0] < _MECHANIC_BUCKETS_TTL:
+            return _mechanic_buckets_cache[1]
+
+        # Top-performing and underperforming mechanics in one round trip
+        result = await db.execute(_MECHANIC_BUCKETS_STMT)
+
+        top_rows, poor_rows = [], []
+        for row in result:
+            (top_rows if row.bucket == "top" else poor_rows).append(row)
+
+        top_rows.sort(key=lambda r: r.weight, reverse=True)
+        poor_rows.sort(key=lambda r: r.weight)
+        buckets = (
+            tuple(r.mechanic_name for r in top_rows),
+            tuple(r.mechanic_name for r in poor_rows),
+        )
+
+        _mechanic_buckets_cache = (now, buckets)
+        return buckets
+
     async def validate(
         self,
         db: AsyncSession,
@@ -5,153 +5,292 @@ Main task definitions for the game generation pipeline.
 """
 
 import asyncio
+import threading
 import uuid as uuid_module
 from datetime import date, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 import structlog
+from celery import chain, group
 from celery.exceptions import Retry
+from celery.signals import worker_process_init, worker_process_shutdown
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.models.build import GameBuild
+from app.services.analytics_service import AnalyticsService
+from app.services.asset_service import get_asset_service
+from app.services.batch_service import BatchService
+from app.services.game_service import GameService
+from app.services.github_service import get_github_service
+from app.services.logging_service import LoggingService
 from app.workers.celery_app import celery_app
+from app.workers.step_executors import STEP_NAMES, BaseStepExecutor, get_step_executor
+
+try:
+    # libuv-backed loop; installed with uvicorn[standard] on Linux/macOS
+    from uvloop import new_event_loop as _new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
 
 logger = structlog.get_logger()
 
+# One engine and event loop per worker process. asyncpg connections are
+# bound to the loop that opened them, so the pool is only reusable if every
+# task in the process runs on the same loop. The loop runs forever on a
+# daemon thread and tasks submit coroutines to it.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_THREAD: Optional[threading.Thread] = None
+_LOOP_LOCK = threading.Lock()
+_ENGINE = None
+_TASK_POOL_SIZE = 10
+_SESSION_FACTORY: Optional[async_sessionmaker] = None
+
+# Step names and executors indexed by step number. Executors only hold
+# service singletons, so one instance per step serves every task; they are
+# built per worker process rather than at import.
+_MAX_STEP = 12
+_STEP_NAMES: Tuple[str, ...] = tuple(
+    STEP_NAMES.get(step_number, f"Step {step_number}")
+    for step_number in range(_MAX_STEP + 1)
+)
+_EXECUTORS: Optional[Tuple[Optional[BaseStepExecutor], ...]] = None
+
+
+def _get_executors() -> Tuple[Optional[BaseStepExecutor], ...]:
+    """Return the per-process step executors, creating them on first use."""
+    global _EXECUTORS
+    if _EXECUTORS is None:
+        _EXECUTORS = tuple(
+            get_step_executor(step_number) for step_number in range(_MAX_STEP + 1)
+        )
+    return _EXECUTORS
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's background event loop, starting it on first use."""
+    global _LOOP, _LOOP_THREAD
+    if _LOOP_THREAD is not None and _LOOP_THREAD.is_alive():
+        return _LOOP
+    with _LOOP_LOCK:
+        # A thread started before a fork does not exist in the child, so
+        # check liveness rather than whether the loop was ever created.
+        if _LOOP_THREAD is None or not _LOOP_THREAD.is_alive():
+            _LOOP = _new_event_loop()
+            _LOOP_THREAD = threading.Thread(
+                target=_LOOP.run_forever,
+                name="celery-async-loop",
+                daemon=True,
+            )
+            _LOOP_THREAD.start()
+    return _LOOP
+
 
 def run_async(coro):
     """Helper to run async code in sync context."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    loop = _get_loop()
+    if threading.get_ident() == _LOOP_THREAD.ident:
+        # Blocking on the loop from its own thread would deadlock, and a
+        # private loop cannot use the pooled connections bound to this one
+        coro.close()
+        raise RuntimeError("run_async called from the worker event loop; await instead")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
     try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
-
-
-def get_task_session():
-    """
-    Create a fresh database session for a Celery task.
-    
-    Each task gets its own engine to avoid connection conflicts
-    when multiple tasks run concurrently.
-    """
-    from app.db.session import Base
-    
-    engine = create_async_engine(
+        return future.result()
+    except BaseException:
+        # e.g. SoftTimeLimitExceeded raised in this thread while waiting;
+        # don't leave the coroutine running on the shared loop.
+        future.cancel()
+        raise
+
+
+def _init_engine() -> None:
+    """Create the process-wide engine and session factory."""
+    global _ENGINE, _SESSION_FACTORY
+    _ENGINE = create_async_engine(
         str(settings.database_url),
-        pool_size=2,
-        max_overflow=3,
+        pool_size=_TASK_POOL_SIZE,
+        max_overflow=5,
         echo=False,
         future=True,
         pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args={
+            # Keep more prepared statements warm per pooled connection
+            "prepared_statement_cache_size": 500,
+            "statement_cache_size": 500,
+            # Task queries are short OLTP lookups; JIT compilation only
+            # adds startup latency to them
+            "server_settings": {"jit": "off"},
+        },
     )
-    
-    session_factory = async_sessionmaker(
-        engine,
+    _SESSION_FACTORY = async_sessionmaker(
+        _ENGINE,
         class_=AsyncSession,
         expire_on_commit=False,
         autocommit=False,
         autoflush=False,
     )
+
+
+@worker_process_init.connect
+def _on_worker_process_init(**kwargs) -> None:
+    """Build the engine and services in each forked worker, never in the parent."""
+    _init_engine()
+    # Create the service singletons up front so the first task doesn't pay
+    # for client setup; tasks reuse them for the life of the process.
+    get_asset_service()
+    get_github_service()
+    _get_executors()
+
+
+@worker_process_shutdown.connect
+def _on_worker_process_shutdown(**kwargs) -> None:
+    """Close pooled connections once when the worker process exits."""
+    global _ENGINE, _SESSION_FACTORY
+    if _ENGINE is None:
+        return
+    # Each step runs even if an earlier one fails, so a failed HTTP client
+    # close cannot leave database connections open
+    try:
+        run_async(get_github_service().aclose())
+    except Exception as e:
+        logger.error("github_client_close_failed", error=str(e))
+    try:
+        run_async(_ENGINE.dispose())
+    except Exception as e:
+        logger.error("engine_dispose_failed", error=str(e))
+    _ENGINE = None
+    _SESSION_FACTORY = None
+    try:
+        if _LOOP is not None:
+            _LOOP.call_soon_threadsafe(_LOOP.stop)
+    except Exception as e:
+        logger.error("event_loop_stop_failed", error=str(e))
+
+
+def _as_uuid(value) -> uuid_module.UUID:
+    """
+    Return a task's ID argument as a UUID.
     
-    return session_factory, engine
+    Callers pass UUIDs, which kombu's JSON serializer round-trips as
+    UUID objects; strings are still accepted from older messages.
+    """
+    if isinstance(value, uuid_module.UUID):
+        return value
+    return uuid_module.UUID(value)
 
 
-@celery_app.task(bind=True, max_retries=3)
-def process_batch(self, batch_id: str):
+def get_task_session() -> async_sessionmaker:
     """
-    Process a batch of games.
+    Return the shared session factory for Celery tasks.
+    
+    The engine is created once per worker process (see
+    worker_process_init) so tasks reuse pooled connections instead of
+    opening and disposing a new engine each time. It is created lazily
+    when tasks run outside a worker, e.g. eagerly in tests.
+    """
+    if _SESSION_FACTORY is None:
+        _init_engine()
+    return _SESSION_FACTORY
 
-    Orchestrates the generation of all games in a batch.
+
+def pipeline_signature(game_id: uuid_module.UUID, start_step: int = 1):
     """
-    logger.info("batch_processing_started", batch_id=batch_id)
+    Build the chain that runs a game's steps from start_step through 12.
 
-    async def _process():
-        from app.services.batch_service import BatchService
-        from app.services.game_service import GameService
+    Immutable signatures keep each link's own arguments instead of
+    receiving the previous step's return value.
+    """
+    return chain(
+        *(
+            execute_step.si(game_id, step_number)
+            for step_number in range(start_step, _MAX_STEP + 1)
+        )
+    )
 
-        session_factory, engine = get_task_session()
-        
-        try:
-            async with session_factory() as db:
-                batch_service = BatchService(db)
-                game_service = GameService(db)
 
-                # Convert string to UUID
-                batch_uuid = uuid_module.UUID(batch_id)
-                batch = await batch_service.get_batch(batch_uuid)
-                if not batch:
-                    logger.error("batch_not_found", batch_id=batch_id)
-                    return
+@celery_app.task(bind=True, max_retries=3, ignore_result=True)
+def process_batch(self, batch_id: uuid_module.UUID):
+    """
+    Process a batch of games.
 
-                # Process each game
-                game_ids = []
-                for game in batch.games:
-                    if game.status == "cancelled":
-                        continue
+    Orchestrates the generation of all games in a batch.
+    """
+    batch_uuid = _as_uuid(batch_id)
+    log = logger.bind(batch_id=str(batch_uuid))
+    log.info("batch_processing_started")
 
-                    # Initialize steps if not done
-                    steps = await game_service.get_game_steps(game.id)
-                    if not steps:
-                        await game_service._initialize_steps(game.id)
-                    
-                    game_ids.append(str(game.id))
+    async def _process():
+        session_factory = get_task_session()
+        
+        async with session_factory() as db:
+            batch_service = BatchService(db)
+            game_service = GameService(db)
+
+            batch = await batch_service.get_batch(batch_uuid)
+            if not batch:
+                log.error("batch_not_found")
+                return
+
+            # Process each game
+            game_uuids = [game.id for game in batch.games if game.status != "cancelled"]
+
+            # Initialize steps for games that don't have them yet
+            existing = await game_service.get_games_with_steps(game_uuids)
+            await game_service._initialize_steps_bulk(
+                game_uuid for game_uuid in game_uuids if game_uuid not in existing
+            )
 
-                await db.commit()
+            await db.commit()
 
-            # Queue step execution AFTER closing the session
-            for game_id in game_ids:
-                execute_step.delay(game_id, 1)
+        # Queue each game's pipeline AFTER closing the session. The group
+        # reuses one pooled producer for every game; each pipeline is still
+        # its own publish.
+        if game_uuids:
+            group(pipeline_signature(game_uuid) for game_uuid in game_uuids).apply_async()
 
-            logger.info(
-                "batch_games_queued",
-                batch_id=batch_id,
-                game_count=len(game_ids),
-            )
-        finally:
-            await engine.dispose()
+        log.info("batch_games_queued", game_count=len(game_uuids))
 
     run_async(_process())
 
 
-@celery_app.task(bind=True, max_retries=3)
-def execute_step(self, game_id: str, step_number: int):
+@celery_app.task(bind=True, max_retries=3, ignore_result=True)
+def execute_step(self, game_id: uuid_module.UUID, step_number: int):
     """
     Execute a single workflow step for a game.
 
-    Steps are executed sequentially - completion of one step
-    triggers the next step.
+    Steps run as links of the chain built by pipeline_signature(). A step
+    that fails or is skipped stops the chain so later steps never run.
     """
-    logger.info(
-        "step_execution_started",
-        game_id=game_id,
-        step_number=step_number,
-    )
+    game_uuid = _as_uuid(game_id)
+    log = logger.bind(game_id=str(game_uuid), step_number=step_number)
+    log.info("step_execution_started")
 
     async def _execute():
-        from app.services.game_service import GameService
-        from app.services.logging_service import LoggingService
-        from app.workers.step_executors import get_step_executor, STEP_NAMES
-
-        session_factory, engine = get_task_session()
-        trigger_next_step = False
+        session_factory = get_task_session()
+        step_succeeded = False
         
-        try:
-            async with session_factory() as db:
-                log_service = LoggingService(db)
-                game_uuid = uuid_module.UUID(game_id)
-                step_name = STEP_NAMES.get(step_number, f"Step {step_number}")
-                
+        async with session_factory() as db:
+            log_service = LoggingService(db)
+            step_name = (
+                _STEP_NAMES[step_number]
+                if 0 <= step_number <= _MAX_STEP
+                else f"Step {step_number}"
+            )
+            
+            # Log rows are written by the step's commits rather than
+            # flushed one INSERT at a time
+            async with log_service.buffered():
                 try:
                     game_service = GameService(db)
                     game = await game_service.get_game(game_uuid)
 
                     if not game:
-                        logger.error("game_not_found", game_id=game_id)
+                        log.error("game_not_found")
                         await log_service.error(
                             "game_not_found",
-                            f"Game {game_id} not found",
+                            f"Game {game_uuid} not found",
                             game_id=game_uuid,
                             step_number=step_number,
                         )
@@ -159,7 +298,7 @@ def execute_step(self, game_id: str, step_number: int):
                         return
 
                     if game.status == "cancelled":
-                        logger.info("game_cancelled_skipping", game_id=game_id)
+                        log.info("game_cancelled_skipping")
                         await log_service.warning(
                             "game_cancelled",
                             "Game was cancelled, skipping",
@@ -181,11 +320,7 @@ def execute_step(self, game_id: str, step_number: int):
                     # Get step and mark as running
                     step = await game_service.get_step(game_uuid, step_number)
                     if not step:
-                        logger.error(
-                            "step_not_found",
-                            game_id=game_id,
-                            step_number=step_number,
-                        )
+                        log.error("step_not_found")
                         await log_service.error(
                             "step_not_found",
                             f"Step {step_number} record not found",
@@ -200,8 +335,10 @@ def execute_step(self, game_id: str, step_number: int):
                         game_uuid,
                         step_number,
                         status="running",
+                        commit=False,
+                        step=step,
                     )
-                    
+                
                     await log_service.info(
                         "step_running",
                         f"Step {step_number} ({step_name}) is now running",
@@ -211,7 +348,11 @@ def execute_step(self, game_id: str, step_number: int):
                     )
 
                     # Get and execute the step
-                    executor = get_step_executor(step_number)
+                    executor = (
+                        _get_executors()[step_number]
+                        if 0 <= step_number <= _MAX_STEP
+                        else None
+                    )
                     if not executor:
                         await log_service.error(
                             "no_executor",
@@ -225,6 +366,8 @@ def execute_step(self, game_id: str, step_number: int):
                             step_number,
                             status="failed",
                             error_message=f"No executor for step {step_number}",
+                            commit=False,
+                            step=step,
                         )
                         await db.commit()
                         return
@@ -236,7 +379,11 @@ def execute_step(self, game_id: str, step_number: int):
                         batch_id=game.batch_id,
                         step_number=step_number,
                     )
-                    
+
+                    # One commit for the start-of-step writes so the running
+                    # status is visible while the executor works
+                    await db.commit()
+                
                     result = await executor.execute(db, game)
 
                     if result["success"]:
@@ -246,7 +393,7 @@ def execute_step(self, game_id: str, step_number: int):
                             step_name=step_name,
                             batch_id=game.batch_id,
                         )
-                        
+                    
                         await game_service.update_step_status(
                             game_uuid,
                             step_number,
@@ -254,9 +401,10 @@ def execute_step(self, game_id: str, step_number: int):
                             artifacts=result.get("artifacts", {}),
                             validation_results=result.get("validation", {}),
                             logs=result.get("logs"),
+                            commit=False,
+                            step=step,
                         )
 
-                        # Flag to trigger next step after session closes
                         if step_number < 12:
                             await log_service.info(
                                 "next_step_queued",
@@ -265,7 +413,6 @@ def execute_step(self, game_id: str, step_number: int):
                                 batch_id=game.batch_id,
                                 step_number=step_number,
                             )
-                            trigger_next_step = True
                         else:
                             await log_service.info(
                                 "game_complete",
@@ -274,10 +421,7 @@ def execute_step(self, game_id: str, step_number: int):
                                 batch_id=game.batch_id,
                                 step_number=step_number,
                             )
-                            logger.info(
-                                "game_generation_complete",
-                                game_id=game_id,
-                            )
+                            log.info("game_generation_complete")
                     else:
                         error_msg = result.get("error", "Unknown error")
                         await log_service.step_failed(
@@ -287,58 +431,53 @@ def execute_step(self, game_id: str, step_number: int):
                             error_message=error_msg,
                             batch_id=game.batch_id,
                         )
-                        
+                    
                         await game_service.update_step_status(
                             game_uuid,
                             step_number,
                             status="failed",
                             error_message=error_msg,
                             logs=result.get("logs"),
+                            commit=False,
+                            step=step,
                         )
-                        logger.warning(
-                            "step_execution_failed",
-                            game_id=game_id,
-                            step_number=step_number,
-                            error=error_msg,
-                        )
+                        log.warning("step_execution_failed", error=error_msg)
 
                     await db.commit()
+                    step_succeeded = result["success"]
 
                 except Exception as e:
                     await db.rollback()
-                    logger.exception(
-                        "step_execution_error",
-                        game_id=game_id,
-                        step_number=step_number,
-                        error=str(e),
-                    )
-                    
+                    log.exception("step_execution_error", error=str(e))
+                
                     # Try to mark step as failed in a new transaction
                     try:
                         game_service = GameService(db)
                         await game_service.update_step_status(
-                            uuid_module.UUID(game_id),
+                            game_uuid,
                             step_number,
                             status="failed",
                             error_message=str(e),
+                            commit=False,
                         )
                         await db.commit()
                     except Exception:
-                        logger.error("failed_to_update_step_status", game_id=game_id)
+                        await db.rollback()
+                        log.error("failed_to_update_step_status")
 
-        finally:
-            await engine.dispose()
-        
-        # Trigger next step AFTER closing session and disposing engine
-        if trigger_next_step:
-            execute_step.delay(game_id, step_number + 1)
+        return step_succeeded
 
-    run_async(_execute())
+    # The request context is thread-local, so the chain has to be cut
+    # here rather than inside the coroutine.
+    if not run_async(_execute()):
+        self.request.chain = None
 
 
 @celery_app.task
-def generate_assets(game_id: str, asset_type: str, spec: dict):
+def generate_assets(game_id: uuid_module.UUID, asset_type: str, spec: dict):
     """Generate AI assets for a game."""
+    game_uuid = _as_uuid(game_id)
+    game_id = str(game_uuid)
     logger.info(
         "asset_generation_started",
         game_id=game_id,
@@ -346,37 +485,30 @@ def generate_assets(game_id: str, asset_type: str, spec: dict):
     )
 
     async def _generate():
-        from app.services.asset_service import get_asset_service
-        from app.services.game_service import GameService
-
-        session_factory, engine = get_task_session()
+        session_factory = get_task_session()
         
-        try:
-            async with session_factory() as db:
-                game_service = GameService(db)
-                game_uuid = uuid_module.UUID(game_id)
-                game = await game_service.get_game(game_uuid)
-                
-                if not game or not game.gdd_spec:
-                    return {"success": False, "error": "Game or GDD not found"}
-                
-                asset_service = get_asset_service()
-                result = await asset_service.generate_asset(
-                    game_id=game_id,
-                    asset_type=asset_type,
-                    asset_name=spec.get("name", asset_type),
-                    description=spec.get("description", ""),
-                    style_guide=game.gdd_spec.get("asset_style_guide", {}),
-                    output_path=asset_service.storage_path / game_id,
-                )
-                return result
-        finally:
-            await engine.dispose()
+        async with session_factory() as db:
+            game_service = GameService(db)
+            game = await game_service.get_game(game_uuid)
+            
+            if not game or not game.gdd_spec:
+                return {"success": False, "error": "Game or GDD not found"}
+            
+            asset_service = get_asset_service()
+            result = await asset_service.generate_asset(
+                game_id=game_id,
+                asset_type=asset_type,
+                asset_name=spec.get("name", asset_type),
+                description=spec.get("description", ""),
+                style_guide=game.gdd_spec.get("asset_style_guide", {}),
+                output_path=asset_service.storage_path / game_id,
+            )
+            return result
 
     return run_async(_generate())
 
 
-@celery_app.task
+@celery_app.task(ignore_result=True)
 def aggregate_daily_metrics(target_date: Optional[str] = None):
     """Aggregate metrics for all games."""
     if target_date:
@@ -387,49 +519,67 @@ def aggregate_daily_metrics(target_date: Optional[str] = None):
     logger.info("metrics_aggregation_started", date=str(_date))
 
     async def _aggregate():
-        from app.services.analytics_service import AnalyticsService
-        from app.services.game_service import GameService
-
-        session_factory, engine = get_task_session()
+        session_factory = get_task_session()
         
+        # Aggregate games concurrently, at most one per pooled connection.
+        # A session is not safe to share between coroutines, so each game
+        # gets its own.
+        semaphore = asyncio.Semaphore(_TASK_POOL_SIZE)
+        pending = set()
+        game_count = 0
+
+        async def _aggregate_game(game_id: uuid_module.UUID) -> None:
+            try:
+                async with session_factory() as game_db:
+                    await AnalyticsService(game_db).aggregate_metrics_for_date(
+                        game_id,
+                        _date,
+                    )
+            except Exception as e:
+                logger.error(
+                    "metrics_aggregation_error",
+                    game_id=str(game_id),
+                    error=str(e),
+                )
+            finally:
+                semaphore.release()
+
         try:
             async with session_factory() as db:
                 game_service = GameService(db)
-                analytics_service = AnalyticsService(db)
 
-                # Get all active games
-                games = await game_service.list_games(
-                    limit=1000,
-                    status="completed",
-                )
-
-                for game in games:
-                    try:
-                        await analytics_service.aggregate_metrics_for_date(
-                            game.id,
-                            _date,
-                        )
-                    except Exception as e:
-                        logger.error(
-                            "metrics_aggregation_error",
-                            game_id=str(game.id),
-                            error=str(e),
-                        )
-
-                logger.info(
-                    "metrics_aggregation_completed",
-                    date=str(_date),
-                    game_count=len(games),
-                )
-        finally:
-            await engine.dispose()
+                # Stream completed game IDs, starting each aggregation as a
+                # slot frees up, so only in-flight games are held in memory
+                async for game_id in game_service.stream_game_ids(status="completed"):
+                    await semaphore.acquire()
+                    task = asyncio.create_task(_aggregate_game(game_id))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                    game_count += 1
+        except BaseException:
+            # Don't leave aggregations running unawaited on the shared loop
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+        if pending:
+            await asyncio.gather(*pending)
+
+        logger.info(
+            "metrics_aggregation_completed",
+            date=str(_date),
+            game_count=game_count,
+        )
 
     run_async(_aggregate())
 
 
 @celery_app.task
-def build_game(game_id: str, build_type: str = "debug"):
+def build_game(game_id: uuid_module.UUID, build_type: str = "debug"):
     """Trigger a game build via GitHub Actions."""
+    game_uuid = _as_uuid(game_id)
+    game_id = str(game_uuid)
     logger.info(
         "build_triggered",
         game_id=game_id,
@@ -437,63 +587,54 @@ def build_game(game_id: str, build_type: str = "debug"):
     )
 
     async def _build():
-        from app.services.game_service import GameService
-        from app.services.github_service import get_github_service
-        from app.models.build import GameBuild
-
-        session_factory, engine = get_task_session()
+        session_factory = get_task_session()
         
-        try:
-            async with session_factory() as db:
-                game_service = GameService(db)
-                github_service = get_github_service()
-                
-                # Convert string to UUID
-                game_uuid = uuid_module.UUID(game_id)
-                game = await game_service.get_game(game_uuid)
-
-                if not game or not game.github_repo:
-                    logger.error(
-                        "build_failed_no_repo",
-                        game_id=game_id,
-                    )
-                    return {"success": False, "error": "No game or repo found"}
-
-                # Trigger GitHub Actions workflow
-                workflow_result = await github_service.trigger_workflow(
-                    repo_name=game.github_repo,
-                    workflow_id="build.yml",
-                    ref="main",
-                    inputs={"build_type": build_type},
+        async with session_factory() as db:
+            game_service = GameService(db)
+            github_service = get_github_service()
+            
+            game = await game_service.get_game(game_uuid)
+
+            if not game or not game.github_repo:
+                logger.error(
+                    "build_failed_no_repo",
+                    game_id=game_id,
                 )
+                return {"success": False, "error": "No game or repo found"}
+
+            # Trigger GitHub Actions workflow
+            workflow_result = await github_service.trigger_workflow(
+                repo_name=game.github_repo,
+                workflow_id="build.yml",
+                ref="main",
+                inputs={"build_type": build_type},
+            )
 
-                # Create build record
-                build = GameBuild(
-                    game_id=game.id,
-                    build_type=build_type,
-                    status="pending" if workflow_result["success"] else "failed",
-                    github_workflow_run_id=workflow_result.get("run_id"),
-                    github_workflow_url=workflow_result.get("url"),
-                )
-                db.add(build)
-                await db.commit()
+            # Create build record
+            build = GameBuild(
+                game_id=game.id,
+                build_type=build_type,
+                status="pending" if workflow_result["success"] else "failed",
+                github_workflow_run_id=workflow_result.get("run_id"),
+                github_workflow_url=workflow_result.get("url"),
+            )
+            db.add(build)
+            await db.commit()
 
-                logger.info(
-                    "build_triggered",
-                    game_id=game_id,
-                    repo=game.github_repo,
-                    build_type=build_type,
-                    success=workflow_result["success"],
-                )
-                
-                return {
-                    "success": workflow_result["success"],
-                    "build_id": str(build.id),
-                    "repo": game.github_repo,
-                    "build_type": build_type,
-                    "workflow_triggered": workflow_result["success"],
-                }
-        finally:
-            await engine.dispose()
+            logger.info(
+                "build_triggered",
+                game_id=game_id,
+                repo=game.github_repo,
+                build_type=build_type,
+                success=workflow_result["success"],
+            )
+            
+            return {
+                "success": workflow_result["success"],
+                "build_id": str(build.id),
+                "repo": game.github_repo,
+                "build_type": build_type,
+                "workflow_triggered": workflow_result["success"],
+            }
 
     return run_async(_build())
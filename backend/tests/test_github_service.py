@@ -0,0 +1,240 @@
+"""
+GitHub Service Tests
+
+Tests for the pure helpers used by the multi-file commit paths.
+"""
+
+import asyncio
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+import httpx
+from github import GithubException
+
+from app.services import github_service
+from app.services.github_service import GitHubService, git_blob_sha
+
+
+def _git_hash_object(data: bytes) -> str:
+    """Ask git itself for the blob SHA of some content."""
+    return subprocess.run(
+        ["git", "hash-object", "--stdin"],
+        input=data,
+        capture_output=True,
+        check=True,
+    ).stdout.decode().strip()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"",
+        b"hello\n",
+        "name: game\nversion: 1.0.0\n",
+        "unicode café ✓\n",
+        bytes(range(256)),
+    ],
+)
+def test_git_blob_sha_matches_git(content):
+    """git_blob_sha agrees with git hash-object for str and bytes content."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    assert git_blob_sha(content) == _git_hash_object(data)
+
+
+def _service_with_tree(entries=None, error=None) -> GitHubService:
+    """Build a GitHubService whose repo returns a fixed tree."""
+    def get_git_tree(branch, recursive=False):
+        if error:
+            raise error
+        return SimpleNamespace(
+            tree=[
+                SimpleNamespace(path=path, sha=sha, type=kind)
+                for path, sha, kind in entries
+            ]
+        )
+
+    service = GitHubService.__new__(GitHubService)
+    service.github = object()
+    service._get_repo = lambda repo_name: SimpleNamespace(get_git_tree=get_git_tree)
+    return service
+
+
+def test_files_match_branch_all_identical():
+    files = {"a.txt": "one\n", "dir/b.bin": b"\x00\x01"}
+    service = _service_with_tree(
+        [(path, git_blob_sha(content), "blob") for path, content in files.items()]
+    )
+    assert asyncio.run(service.files_match_branch("repo", files)) is True
+
+
+def test_files_match_branch_changed_or_missing_file():
+    service = _service_with_tree(
+        [("a.txt", git_blob_sha("one\n"), "blob"), ("dir", "abc", "tree")]
+    )
+    assert asyncio.run(service.files_match_branch("repo", {"a.txt": "two\n"})) is False
+    assert asyncio.run(service.files_match_branch("repo", {"dir": "x"})) is False
+
+
+def test_files_match_branch_lookup_error():
+    service = _service_with_tree(error=GithubException(404, "Not Found", None))
+    assert asyncio.run(service.files_match_branch("repo", {"a.txt": "one\n"})) is False
+
+
+def _service_with_transport(handler) -> GitHubService:
+    """Build a GitHubService whose HTTP client is served by handler."""
+    service = GitHubService.__new__(GitHubService)
+    service.github = object()
+    service.token = "token"
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def get_http_client():
+        return client
+
+    service._get_http_client = get_http_client
+    return service
+
+
+def test_http_client_is_reused_per_loop_and_closed():
+    service = GitHubService.__new__(GitHubService)
+    service._http_clients = {}
+
+    async def use_and_close():
+        client = service._get_http_client()
+        assert service._get_http_client() is client
+        await service.aclose()
+        return client
+
+    first = asyncio.run(use_and_close())
+    second = asyncio.run(use_and_close())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert service._http_clients == {}
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Record rate-limit waits instead of sleeping through them."""
+    waits = []
+
+    async def sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(github_service.asyncio, "sleep", sleep)
+    return waits
+
+
+def test_post_with_backoff_honours_retry_after(no_sleep):
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(403, headers={"Retry-After": "2"}),
+        httpx.Response(201, json={"sha": "abc"}),
+    ])
+    service = _service_with_transport(lambda request: next(responses))
+
+    response = asyncio.run(service._post_with_backoff("https://example.test"))
+
+    assert response.status_code == 201
+    assert no_sleep == [7.0, 2.0]
+
+
+def test_post_with_backoff_does_not_retry_plain_403(no_sleep):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(403)
+
+    service = _service_with_transport(handler)
+
+    response = asyncio.run(service._post_with_backoff("https://example.test"))
+
+    assert response.status_code == 403
+    assert len(calls) == 1
+    assert no_sleep == []
+
+
+def test_commit_files_cancels_uploads_after_first_failure():
+    started = []
+
+    async def run():
+        cancelled = asyncio.Event()
+
+        async def handler(request):
+            started.append(request)
+            if len(started) == 1:
+                return httpx.Response(500)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return httpx.Response(201, json={"sha": "abc"})
+
+        service = _service_with_transport(handler)
+        repo = SimpleNamespace(
+            full_name="org/repo",
+            get_git_ref=lambda ref: SimpleNamespace(object=SimpleNamespace(sha="head")),
+            get_git_commit=lambda sha: SimpleNamespace(tree=None),
+        )
+        files = {f"f{i}.txt": str(i) for i in range(5)}
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await service._commit_files(repo, files, "message", "main")
+        assert cancelled.is_set()
+
+    asyncio.run(run())
+    # The remaining uploads were never started
+    assert len(started) < 5
+
+
+def _service_for_commit(matches: bool, graphql_results):
+    """Build a GitHubService with stubbed commit primitives, recording calls."""
+    calls = []
+    results = iter(graphql_results)
+
+    async def files_match_branch(repo_name, files, branch):
+        calls.append(("match", branch))
+        return matches
+
+    async def create_commit_on_branch_graphql(**kwargs):
+        calls.append(("graphql", kwargs["branch"]))
+        return next(results)
+
+    async def create_multiple_files(repo_name, files, commit_message, branch=None):
+        calls.append(("git_data", branch))
+        return {"success": True, "commit_sha": "abc", "files_created": len(files)}
+
+    service = GitHubService.__new__(GitHubService)
+    service.files_match_branch = files_match_branch
+    service.create_commit_on_branch_graphql = create_commit_on_branch_graphql
+    service.create_multiple_files = create_multiple_files
+    return service, calls
+
+
+def test_commit_files_if_changed_skips_unchanged_files():
+    service, calls = _service_for_commit(True, [])
+
+    result = asyncio.run(
+        service.commit_files_if_changed("repo", {"a.txt": "one\n"}, "msg", branch="dev")
+    )
+
+    assert result == {"success": True, "skipped": True}
+    assert calls == [("match", "dev")]
+
+
+def test_commit_files_if_changed_falls_back_after_retries(no_sleep):
+    failure = {"success": False, "error": "boom"}
+    service, calls = _service_for_commit(
+        False, [failure] * github_service.GRAPHQL_COMMIT_ATTEMPTS
+    )
+
+    result = asyncio.run(
+        service.commit_files_if_changed("repo", {"a.txt": "one\n"}, "msg", branch="dev")
+    )
+
+    assert result["success"] and result["fallback"]
+    assert calls[-1] == ("git_data", "dev")
+    assert calls.count(("graphql", "dev")) == github_service.GRAPHQL_COMMIT_ATTEMPTS
+    assert no_sleep == [1.0, 2.0]
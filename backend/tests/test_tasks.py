@@ -0,0 +1,109 @@
+"""
+Task Tests
+
+Tests for the helpers that build and parse Celery task arguments and
+bridge tasks onto the worker event loop.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from kombu.serialization import dumps, loads
+
+from app.workers.tasks import _as_uuid, execute_step, pipeline_signature, run_async
+
+
+def test_as_uuid_passes_uuid_through():
+    value = uuid.uuid4()
+    assert _as_uuid(value) is value
+
+
+def test_as_uuid_parses_string():
+    value = uuid.uuid4()
+    assert _as_uuid(str(value)) == value
+
+
+def test_as_uuid_rejects_garbage():
+    with pytest.raises(ValueError):
+        _as_uuid("not-a-uuid")
+
+
+def test_pipeline_signature_chains_remaining_steps():
+    game_id = uuid.uuid4()
+    tasks = pipeline_signature(game_id, start_step=10).tasks
+
+    assert [sig.task for sig in tasks] == [execute_step.name] * 3
+    assert [tuple(sig.args) for sig in tasks] == [
+        (game_id, 10),
+        (game_id, 11),
+        (game_id, 12),
+    ]
+    # Immutable, so a step's return value is not passed to the next one
+    assert all(sig.immutable for sig in tasks)
+
+
+def test_pipeline_signature_defaults_to_full_pipeline():
+    tasks = pipeline_signature(uuid.uuid4()).tasks
+    assert [sig.args[1] for sig in tasks] == list(range(1, 13))
+
+
+def test_pipeline_signature_round_trips_uuid_through_json():
+    game_id = uuid.uuid4()
+    content_type, encoding, body = dumps(
+        dict(pipeline_signature(game_id, start_step=11)), serializer="json"
+    )
+    decoded = loads(body, content_type, encoding)
+    first_args = decoded["kwargs"]["tasks"][0]["args"]
+
+    assert first_args[0] == game_id
+    assert isinstance(first_args[0], uuid.UUID)
+
+
+def test_run_async_returns_result():
+    async def answer():
+        return 42
+
+    assert run_async(answer()) == 42
+
+
+def test_run_async_rejects_reentry_from_loop_thread():
+    async def inner():
+        return "unreachable"
+
+    async def outer():
+        return run_async(inner())
+
+    with pytest.raises(RuntimeError):
+        run_async(outer())
+
+
+def test_worker_shutdown_disposes_engine_when_client_close_fails(monkeypatch):
+    from app.workers import tasks
+
+    closed = []
+
+    class FailingGitHub:
+        async def aclose(self):
+            raise RuntimeError("boom")
+
+    class Engine:
+        async def dispose(self):
+            closed.append("engine")
+
+    class Loop:
+        def stop(self):
+            pass
+
+        def call_soon_threadsafe(self, callback):
+            closed.append("loop")
+
+    monkeypatch.setattr(tasks, "run_async", asyncio.run)
+    monkeypatch.setattr(tasks, "get_github_service", FailingGitHub)
+    monkeypatch.setattr(tasks, "_ENGINE", Engine())
+    monkeypatch.setattr(tasks, "_LOOP", Loop())
+
+    tasks._on_worker_process_shutdown()
+
+    assert closed == ["engine", "loop"]
+    assert tasks._ENGINE is None